@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Build a compact, token-budgeted digest for the AI generation step.
+
+Instead of reading github_stats.json, ai_guidelines.md and constants.py in
+full, the AI task reads one small Markdown file with:
+- abbreviated, de-duplicated stats
+- ready-to-paste badge markdown for every detected language (verified icons)
+- only the guideline excerpts relevant to sections that have data
+
+The digest is assembled in priority order and stops adding excerpts once
+the size budget is used up.
+"""
+
+import re
+import sys
+import json
+from typing import Dict, List, Any, Tuple
+from pathlib import Path
+
+try:
+    from constants import (
+        USER_SOCIAL_LINKS, get_language_badge, get_social_badge, get_stats_image
+    )
+except ImportError:
+    # If running from different directory
+    sys.path.insert(0, str(Path(__file__).parent))
+    from constants import (
+        USER_SOCIAL_LINKS, get_language_badge, get_social_badge, get_stats_image
+    )
+
+# Configuration
+DIGEST_FILE = Path("data") / "ai_digest.md"
+GUIDELINES_FILE = Path(__file__).parent / "ai_guidelines.md"
+DIGEST_BUDGET_CHARS = 8000  # Roughly 2,000 tokens
+CHARS_PER_TOKEN = 4         # Rough estimate for English/Markdown
+
+# Guideline headings (lowercase prefixes) relevant to each README section,
+# in priority order. "always" applies to every README.
+SECTION_GUIDELINES = {
+    "always": ["core principles", "formatting rules", "structure & alignment", "tone"],
+    "coder": ["when to show sections"],
+    "activity": ["when to show sections"],
+    "tech": ["content rules"],
+    "extras": ["common mistakes", "best practices"],
+}
+
+
+def split_guidelines(text: str) -> List[Tuple[str, str]]:
+    """
+    Split guidelines Markdown into (heading, body) chunks at ## and ### headings.
+
+    Headings inside fenced code blocks are ignored.
+    """
+    chunks = []
+    heading = ""
+    lines = []
+    in_fence = False
+
+    for line in text.splitlines():
+        if line.startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and re.match(r"#{2,3} ", line):
+            if heading:
+                chunks.append((heading, "\n".join(lines).strip()))
+            heading = line
+            lines = []
+        else:
+            lines.append(line)
+
+    if heading:
+        chunks.append((heading, "\n".join(lines).strip()))
+    return chunks
+
+
+def heading_key(heading: str) -> str:
+    """Normalize a heading for matching: no #s, emojis or leading symbols."""
+    return re.sub(r"^[^a-z0-9]+", "", heading.lstrip("#").strip().lower())
+
+
+def get_language_badges(languages: List[str]) -> Dict[str, str]:
+    """Precompute badge markdown for every detected language."""
+    return {language: get_language_badge(language) for language in languages}
+
+
+def sections_with_data(stats: Dict[str, Any]) -> List[str]:
+    """Decide which README sections have data worth showing."""
+    sections = ["always"]
+    projects = stats.get("tracked_projects") or {"coder": stats.get("coder_stats", {})}
+    if any(p.get("total_prs") or p.get("total_commits") or p.get("total_issues")
+           for p in projects.values()):
+        sections.append("coder")
+    if stats.get("recent_activity"):
+        sections.append("activity")
+    if stats.get("languages", {}).get("all_detected"):
+        sections.append("tech")
+    sections.append("extras")
+    return sections
+
+
+def compact_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Abbreviate github_stats.json, dropping anything repeated or unused."""
+    user = stats.get("user", {})
+    languages = stats.get("languages", {})
+    by_count = languages.get("by_repo_count", {})
+
+    # all_detected/top_8 are subsets of by_repo_count - keep one ordered list
+    compact = {
+        "user": user.get("username"),
+        "name": user.get("name"),
+        "langs": [f"{lang}:{count}" for lang, count in by_count.items()]
+                 or languages.get("all_detected", []),
+    }
+
+    projects = {}
+    for project, data in (stats.get("tracked_projects") or {}).items():
+        if not (data.get("total_prs") or data.get("total_commits") or data.get("total_issues")):
+            continue
+        projects[project] = {
+            "prs": data.get("total_prs", 0),
+            "commits": data.get("total_commits", 0),
+            "issues": data.get("total_issues", 0),
+            "recent_prs": [f"#{pr.get('number')} {pr.get('title', '')}".strip()
+                           for pr in data.get("prs", [])],
+        }
+    if projects:
+        compact["projects"] = projects
+
+    featured = [
+        f"{repo.get('name')} ({repo.get('language') or '-'}, ★{repo.get('stars', 0)}): "
+        f"{repo.get('description', '')}".rstrip(": ")
+        for repo in stats.get("featured_repos", [])
+    ]
+    if featured:
+        compact["featured"] = featured
+
+    activity = [
+        f"{item.get('icon', '')} {item.get('description', '')} ({item.get('date', '')[:10]})".strip()
+        for item in stats.get("recent_activity", [])
+    ]
+    if activity:
+        compact["activity"] = activity
+
+    return compact
+
+
+def trimmable_lists(compact: Dict[str, Any]) -> List[List[str]]:
+    """Lists in the compact stats that may be shortened, least important first."""
+    lists = [compact.get("activity"), compact.get("featured")]
+    lists += [project["recent_prs"] for project in compact.get("projects", {}).values()]
+    lists.append(compact.get("langs"))
+    return [items for items in lists if items]
+
+
+def build_digest(
+    stats: Dict[str, Any],
+    guidelines: str,
+    budget: int = DIGEST_BUDGET_CHARS
+) -> Dict[str, Any]:
+    """
+    Assemble the digest within a character budget.
+
+    Stats and badges come first. If they alone exceed the budget, the
+    activity, featured, recent PR and language lists are shortened from
+    the end until they fit. Guideline excerpts are then added in priority
+    order and skipped once they no longer fit.
+
+    Args:
+        stats: Contents of github_stats.json
+        guidelines: Contents of ai_guidelines.md
+        budget: Maximum digest size in characters
+
+    Returns:
+        Dict with the digest "text", its "chars", estimated "tokens",
+        the guideline excerpts "included"/"skipped", how many list items
+        were "trimmed", and "over_budget" if it still doesn't fit
+    """
+    username = stats.get("user", {}).get("username") or ""
+    languages = stats.get("languages", {}).get("all_detected", [])
+    compact = compact_stats(stats)
+
+    def render() -> str:
+        return "\n".join([
+            "# README digest",
+            "Generated from data/github_stats.json. Use the badge markdown as-is.",
+            "",
+            "## Stats",
+            json.dumps(compact, ensure_ascii=False, separators=(",", ":")),
+            "",
+            "## Language badges",
+            *get_language_badges(languages).values(),
+            "",
+            "## Stats images",
+            *(get_stats_image(username, kind) for kind in ("stats", "languages", "streak")),
+            "",
+            "## Social badges",
+            *(get_social_badge(platform, username, url) for platform, url in USER_SOCIAL_LINKS),
+            "",
+            "## Guidelines",
+        ])
+
+    text = render()
+    trimmed = 0
+    while len(text) > budget:
+        lists = trimmable_lists(compact)
+        if not lists:
+            break
+        lists[0].pop()
+        trimmed += 1
+        text = render()
+
+    chunks = split_guidelines(guidelines)
+    wanted = []
+    for section in sections_with_data(stats):
+        for prefix in SECTION_GUIDELINES.get(section, []):
+            if prefix not in wanted:
+                wanted.append(prefix)
+
+    included = []
+    skipped = []
+    for prefix in wanted:
+        for heading, body in chunks:
+            if not heading_key(heading).startswith(prefix):
+                continue
+            excerpt = f"\n### {heading.lstrip('#').strip()}\n{body}\n"
+            if len(text) + len(excerpt) <= budget:
+                text += excerpt
+                included.append(heading_key(heading))
+            else:
+                skipped.append(heading_key(heading))
+
+    return {
+        "text": text,
+        "chars": len(text),
+        "tokens": len(text) // CHARS_PER_TOKEN,
+        "included": included,
+        "skipped": skipped,
+        "trimmed": trimmed,
+        "over_budget": len(text) > budget,
+    }
+
+
+def write_digest(
+    stats: Dict[str, Any],
+    budget: int = DIGEST_BUDGET_CHARS,
+    digest_file: Path = DIGEST_FILE,
+    guidelines_file: Path = GUIDELINES_FILE
+) -> Dict[str, Any]:
+    """Build the digest and save it next to github_stats.json."""
+    with open(guidelines_file, "r", encoding="utf-8") as f:
+        guidelines = f.read()
+
+    digest = build_digest(stats, guidelines, budget)
+
+    with open(digest_file, "w", encoding="utf-8") as f:
+        f.write(digest["text"])
+
+    print(f"✅ Digest saved to {digest_file}")
+    print(f"   - {digest['chars']} chars (~{digest['tokens']} tokens, budget {budget} chars)")
+    print(f"   - {len(digest['included'])} guideline excerpts included, "
+          f"{len(digest['skipped'])} skipped for budget")
+    if digest["trimmed"]:
+        print(f"   - {digest['trimmed']} stats list items trimmed for budget")
+    if digest["over_budget"]:
+        print(f"⚠️  Digest is {digest['chars']} chars, over its {budget} char budget "
+              f"(stats and badges alone don't fit)", file=sys.stderr)
+    return digest
+
+
+if __name__ == "__main__":
+    with open(Path("data") / "github_stats.json", "r") as f:
+        write_digest(json.load(f), int(sys.argv[1]) if len(sys.argv) > 1 else DIGEST_BUDGET_CHARS)
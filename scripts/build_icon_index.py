@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Rebuild the bundled Simple Icons index (scripts/simple_icons.json).
+
+Reads Simple Icons' data file - simple-icons.json from the npm package or
+the GitHub repo - and keeps only what badges need: slug and brand colour.
+Slugs are taken from the data when present and otherwise derived from the
+title with Simple Icons' own rules (constants.title_to_slug).
+
+The index must come from a pinned release, recorded in its "source", so it
+can be checked against (and bumped along with) what shields.io renders.
+Two PyPI packages ship Simple Icons under its own version number and can be
+used instead of the data file: "django-simple-icons" follows current
+releases, while "simpleicons" stopped at 7.21.0.
+
+Usage:
+    python3 scripts/build_icon_index.py path/or/url/to/simple-icons.json --release 16.35.0
+    pip install django-simple-icons==16.35.0 && python3 scripts/build_icon_index.py django-simple-icons
+"""
+
+import sys
+import json
+import argparse
+import requests
+from zipfile import ZipFile
+from importlib import metadata, resources
+from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+
+try:
+    from constants import SIMPLE_ICONS_FILE, title_to_slug
+except ImportError:
+    # If running from different directory
+    sys.path.insert(0, str(Path(__file__).parent))
+    from constants import SIMPLE_ICONS_FILE, title_to_slug
+
+
+def load_python_package() -> Tuple[List[Dict[str, Any]], str]:
+    """Load icon entries and the release version from the simpleicons package."""
+    from simpleicons.all import icons
+
+    entries = [{"title": icon.title, "slug": icon.slug, "hex": icon.hex} for icon in icons.values()]
+    return entries, metadata.version("simpleicons")
+
+
+def load_django_package() -> Tuple[List[Dict[str, Any]], str]:
+    """Load icon entries and the release version from the django-simple-icons package."""
+    archive_file = resources.files("django_simple_icons").joinpath("simple-icons.zip")
+    with archive_file.open("rb") as f, ZipFile(f) as archive:
+        data = json.loads(archive.read("data.json"))
+
+    return parse_entries(data), metadata.version("django-simple-icons")
+
+
+def parse_entries(data: Any) -> List[Dict[str, Any]]:
+    """Normalize the data file layouts Simple Icons and its mirrors use to a list of entries."""
+    if isinstance(data, list):
+        return data
+    # Older releases wrap the list as {"icons": [...]}
+    if isinstance(data.get("icons"), list):
+        return data["icons"]
+    # django-simple-icons keys entries by slug: {"coder": {"title": ..., "hex": ...}}
+    return [{"slug": slug, **entry} for slug, entry in data.items()]
+
+
+def load_source(source: str) -> List[Dict[str, Any]]:
+    """Load icon entries from a local file or URL (either data file layout)."""
+    if source.startswith(("http://", "https://")):
+        response = requests.get(source, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    return parse_entries(data)
+
+
+def build_index(entries: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map each icon's slug to its brand colour."""
+    return {
+        entry.get("slug") or title_to_slug(entry["title"]): entry["hex"].upper()
+        for entry in entries
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Rebuild simple_icons.json from a pinned Simple Icons release."""
+    parser = argparse.ArgumentParser(description="Rebuild the bundled Simple Icons index")
+    parser.add_argument(
+        "source",
+        help="simple-icons.json path or URL, or 'django-simple-icons' / 'simpleicons' for a PyPI package"
+    )
+    parser.add_argument("--release", help="Simple Icons version of a data file (required for files)")
+    args = parser.parse_args(argv)
+
+    if args.source == "django-simple-icons":
+        entries, release = load_django_package()
+        origin = f"django-simple-icons {release} on PyPI"
+    elif args.source == "simpleicons":
+        entries, release = load_python_package()
+        origin = f"simpleicons {release} on PyPI"
+    elif args.release:
+        entries, release = load_source(args.source), args.release
+        origin = args.source
+    else:
+        print("❌ --release is required so the index records which Simple Icons it matches",
+              file=sys.stderr)
+        return 1
+
+    icons = build_index(entries)
+
+    with open(SIMPLE_ICONS_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "source": f"simple-icons {release} ({origin})",
+                "release": release,
+                "icons": dict(sorted(icons.items())),
+            },
+            f, indent=0, separators=(",", ":")
+        )
+        f.write("\n")
+
+    print(f"✅ Wrote {len(icons)} icons from simple-icons {release} to {SIMPLE_ICONS_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
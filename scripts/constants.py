@@ -9,11 +9,16 @@ but all helpers guarantee URLs from trusted services.
 Philosophy:
 - Provide tools, not rigid templates
 - Enable AI creativity within safe boundaries
-- All generated URLs are guaranteed to work
-- No runtime verification needed
+- All generated URLs come from trusted services
+- validate_links.py checks the finished README in case a service goes down
 """
 
-# Trusted image services (no verification needed)
+import json
+import unicodedata
+from pathlib import Path
+from urllib.parse import quote
+
+# Trusted image services (validate_links.py flags images from any other host)
 TRUSTED_SERVICES = [
     "shields.io",           # Badge generation service
     "simpleicons.org",      # Icon library
@@ -77,7 +82,8 @@ def get_skill_badge(name: str, icon_slug: str, color: str, style: str = None) ->
     if style is None:
         style = DEFAULT_BADGE_STYLE
     
-    name_encoded = name.replace(" ", "%20")
+    # Shields.io reads "-" and "_" in the path as separators, so double them
+    name_encoded = quote(name.replace("-", "--").replace("_", "__"), safe="")
     
     # Build URL
     if icon_slug and icon_slug.lower() != "none":
@@ -90,22 +96,90 @@ def get_skill_badge(name: str, icon_slug: str, color: str, style: str = None) ->
 
 def is_simple_icon_available(icon_slug: str) -> bool:
     """
-    Check if an icon slug is likely valid for Simple Icons.
+    Check if an icon slug exists in Simple Icons.
     
-    This is a lightweight check - we trust Simple Icons to be available.
-    Use this for dynamic icon selection to avoid typos.
+    Looks the slug up in the bundled offline index (simple_icons.json),
+    so there's no network request and no guessing.
     
     Args:
         icon_slug: Simple Icons slug to validate
     
     Returns:
-        True if the slug follows Simple Icons naming conventions
+        True if the slug is in the index
     """
     if not icon_slug or icon_slug.lower() == "none":
         return False
     
-    # Simple Icons slugs are lowercase alphanumeric with optional hyphens
-    return icon_slug.replace("-", "").replace(".", "").isalnum() and icon_slug.islower()
+    return icon_slug in get_icon_index()
+
+
+def get_icon_index() -> dict:
+    """
+    Load the bundled Simple Icons index on first use.
+    
+    Returns:
+        Dict mapping icon slug to brand colour (hex, without #)
+    """
+    global _ICON_INDEX
+    if _ICON_INDEX is None:
+        with open(SIMPLE_ICONS_FILE, "r", encoding="utf-8") as f:
+            _ICON_INDEX = json.load(f)["icons"]
+    return _ICON_INDEX
+
+
+def title_to_slug(title: str) -> str:
+    """
+    Convert a name to a Simple Icons slug using Simple Icons' own rules.
+    
+    Example:
+        title_to_slug("Node.js") -> "nodedotjs"
+        title_to_slug("C++") -> "cplusplus"
+    """
+    slug = "".join(SLUG_REPLACEMENTS.get(char, char) for char in title.lower())
+    slug = unicodedata.normalize("NFD", slug)
+    return "".join(char for char in slug if char.isascii() and char.isalnum())
+
+
+def resolve_icon(name: str):
+    """
+    Find the Simple Icons slug and colour for a language or technology.
+    
+    Checks, in order: COMMON_TECH, LANGUAGE_ICON_ALIASES, then the name's
+    own Simple Icons slug. Every step is a dict lookup.
+    
+    Args:
+        name: Display name, e.g. a language from GitHub ("Vue", "HCL")
+    
+    Returns:
+        (icon_slug, color) tuple, or None if no verified icon exists
+    """
+    key = name.lower()
+    
+    if key in _COMMON_TECH_BY_NAME:
+        return _COMMON_TECH_BY_NAME[key]
+    
+    index = get_icon_index()
+    slug = LANGUAGE_ICON_ALIASES.get(key) or title_to_slug(name)
+    if slug in index:
+        return slug, index[slug]
+    
+    return None
+
+
+def get_language_badge(name: str, style: str = None) -> str:
+    """
+    Generate a badge for any detected language or technology.
+    
+    Uses the verified icon and brand colour when one exists, otherwise a
+    plain badge in Coder blue - never a guessed slug.
+    
+    Example:
+        get_language_badge("Vue")  # vuedotjs icon, 4FC08D
+    """
+    icon = resolve_icon(name)
+    if icon:
+        return get_skill_badge(name, icon[0], icon[1], style)
+    return get_skill_badge(name, "none", COLORS["coder_blue"], style)
 
 
 def get_social_badge(platform: str, username: str, url: str) -> str:
@@ -121,7 +195,7 @@ def get_social_badge(platform: str, username: str, url: str) -> str:
         Markdown link with badge image
     """
     colors = {
-        "Twitter": "1DA1F2",
+        "Twitter": "000000",
         "Discord": "5865F2",
         "Email": "D14836",
         "LinkedIn": "0077B5",
@@ -129,17 +203,19 @@ def get_social_badge(platform: str, username: str, url: str) -> str:
     }
     
     icons = {
-        "Twitter": "twitter",
+        "Twitter": "x",
         "Discord": "discord",
         "Email": "gmail",
-        "LinkedIn": "linkedin",
+        "LinkedIn": "none",  # Not in the bundled Simple Icons release
         "GitHub": "github",
     }
     
     color = colors.get(platform, "000000")
     icon = icons.get(platform, platform.lower())
     
-    badge_url = f"https://img.shields.io/badge/{platform}-{color}?style={BADGE_STYLE}&logo={icon}&logoColor=white"
+    badge_url = f"https://img.shields.io/badge/{platform}-{color}?style={DEFAULT_BADGE_STYLE}"
+    if icon != "none":
+        badge_url += f"&logo={icon}&logoColor=white"
     return f'<a href="{url}" target="_blank"><img src="{badge_url}" alt="{platform}" /></a>'
 
 
@@ -177,7 +253,8 @@ def get_stats_image(username: str, stat_type: str) -> str:
 # The AI can choose which to include, modify, or add new ones using the helpers
 # ============================================================================
 
-# Common tech stack with verified Simple Icons slugs
+# Common tech stack with verified Simple Icons slugs ("none" = no icon in the
+# bundled release; test_constants checks every slug against simple_icons.json)
 # Find more at: https://simpleicons.org/
 COMMON_TECH = {
     "Languages": {
@@ -186,7 +263,7 @@ COMMON_TECH = {
         "JavaScript": ("javascript", "F7DF1E"),
         "Go": ("go", "00ADD8"),
         "Bash": ("gnubash", "4EAA25"),
-        "Java": ("java", "007396"),
+        "Java": ("openjdk", "007396"),  # Simple Icons dropped "java"; brand blue, not OpenJDK's black
         "C++": ("cplusplus", "00599C"),
         "Rust": ("rust", "000000"),
         "Ruby": ("ruby", "CC342D"),
@@ -200,19 +277,19 @@ COMMON_TECH = {
         "Redis": ("redis", "DC382D"),
         "MySQL": ("mysql", "4479A1"),
         "MongoDB": ("mongodb", "47A248"),
-        "AWS": ("amazonaws", "232F3E"),
+        "AWS": ("none", "232F3E"),  # Not in the bundled Simple Icons release
         "GCP": ("googlecloud", "4285F4"),
-        "Azure": ("microsoftazure", "0078D4"),
+        "Azure": ("none", "0078D4"),  # Not in the bundled Simple Icons release
     },
     "Development Tools": {
         "Coder": ("coder", "00ADD8"),
         "Git": ("git", "F05032"),
         "GitHub": ("github", "181717"),
-        "VS Code": ("visualstudiocode", "007ACC"),
+        "VS Code": ("none", "007ACC"),  # Not in the bundled Simple Icons release
         "Neovim": ("neovim", "57A143"),
         "Vim": ("vim", "019733"),
         "JetBrains": ("jetbrains", "000000"),
-        "Cursor": ("cursor", "000000"),  # Use generic or none if no icon
+        "Cursor": ("cursor", "000000"),
     },
     "Frameworks": {
         "React": ("react", "61DAFB"),
@@ -227,11 +304,51 @@ COMMON_TECH = {
     },
 }
 
+# Bundled Simple Icons index: {"icons": {slug: hex}}, loaded lazily
+SIMPLE_ICONS_FILE = Path(__file__).parent / "simple_icons.json"
+_ICON_INDEX = None
+
+# Characters Simple Icons spells out when building slugs from titles
+SLUG_REPLACEMENTS = {
+    "+": "plus", ".": "dot", "&": "and", "đ": "d", "ħ": "h", "ı": "i", "ĸ": "k",
+    "ŀ": "l", "ł": "l", "ß": "ss", "ŧ": "t", "ø": "o",
+}
+
+# GitHub language names whose Simple Icons slug isn't derived from the name.
+# Keys are lowercase.
+LANGUAGE_ICON_ALIASES = {
+    "shell": "gnubash",
+    "bash": "gnubash",
+    "dockerfile": "docker",
+    "hcl": "terraform",
+    "vue": "vuedotjs",
+    "html": "html5",
+    "scss": "sass",
+    "f#": "fsharp",
+    "tex": "latex",
+    "vim script": "vim",
+    "vim snippet": "vim",
+    "jupyter notebook": "jupyter",
+    "nix": "nixos",
+    "makefile": "gnu",
+    "gdscript": "godotengine",
+    "plpgsql": "postgresql",
+    "smarty": "php",
+    "blade": "laravel",
+}
+
+# Lowercase COMMON_TECH lookup, built once
+_COMMON_TECH_BY_NAME = {
+    tech.lower(): icon
+    for category in COMMON_TECH.values()
+    for tech, icon in category.items()
+}
+
 # Social platforms with proper branding
 SOCIAL_PLATFORMS = {
-    "Twitter": ("twitter", "1DA1F2"),
+    "Twitter": ("x", "000000"),  # Simple Icons only has the X logo
     "Discord": ("discord", "5865F2"),
-    "LinkedIn": ("linkedin", "0077B5"),
+    "LinkedIn": ("none", "0077B5"),  # Not in the bundled Simple Icons release
     "GitHub": ("github", "181717"),
     "Email": ("gmail", "D14836"),
     "Mastodon": ("mastodon", "6364FF"),
@@ -10,124 +10,532 @@ don't require runtime verification.
 import os
 import sys
 import json
+import math
+import heapq
+import argparse
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 # Import our constants and helpers
 try:
     from constants import (
-        TECH_STACK, SOCIAL_LINKS, get_skill_badge, 
+        SOCIAL_LINKS, get_skill_badge,
         get_social_badge, get_stats_image, CODER_BLUE
     )
+    from ai_digest import write_digest, DIGEST_BUDGET_CHARS
+    from pipeline import Stage, run_pipeline
+    from token_pool import TokenPool, resource_for_path
+    import section_cache
 except ImportError:
     # If running from different directory
     sys.path.insert(0, str(Path(__file__).parent))
     from constants import (
-        TECH_STACK, SOCIAL_LINKS, get_skill_badge,
+        SOCIAL_LINKS, get_skill_badge,
         get_social_badge, get_stats_image, CODER_BLUE
     )
+    from ai_digest import write_digest, DIGEST_BUDGET_CHARS
+    from pipeline import Stage, run_pipeline
+    from token_pool import TokenPool, resource_for_path
+    import section_cache
 
 # Configuration
 GITHUB_USERNAME = "DevelopmentCats"
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
+TOKEN_POOL = TokenPool.from_env()  # GITHUB_TOKENS (comma separated) + GITHUB_TOKEN
+GITHUB_API = os.getenv("GITHUB_API_URL", "https://api.github.com")
 DATA_DIR = Path("data")
 TEMPLATES_DIR = Path("templates")
 
+# Freshness policy: seconds a previous response (kept in data/github_data.json)
+# is reused before that resource is fetched again. The workflow runs twice a week.
+RESOURCE_TTLS = {
+    "user": 7 * 24 * 3600,   # Profile counts barely move between runs
+    "repos": 6 * 24 * 3600,  # Repo metadata and languages change slowly
+    "events": 0,             # The activity feed is always fetched
+}
+
+# Coder Registry contribution index (built from the search API)
+REGISTRY_REPO = "coder/registry"
+REGISTRY_INDEX_FILE = DATA_DIR / "registry_index.json"
+SEARCH_PAGE_SIZE = 100     # Maximum page size for search endpoints
+SEARCH_MAX_RESULTS = 1000  # GitHub search never returns more than this per query
+SEARCH_WORKERS = 4         # Concurrent page fetches
+
+# Recent activity ranking (see get_recent_activity)
+ACTIVITY_LIMIT = 10             # Number of items to keep
+ACTIVITY_HALF_LIFE_HOURS = 72   # A score halves every 3 days
+ACTIVITY_WEIGHTS = {
+    "release": 10.0,
+    "pr_merged": 9.0,
+    "pr_opened": 6.0,
+    "issue_opened": 5.0,
+    "issue_closed": 4.0,
+    "create": 4.0,
+    "pr_closed": 3.0,
+    "push": 2.0,
+}
+
+# Featured repositories ranking (see get_featured_repos)
+FEATURED_LIMIT = 6               # Number of repos to feature
+FEATURED_HALF_LIFE_DAYS = 90     # Recency bonus halves every ~3 months
+FEATURED_WEIGHTS = {
+    "stars": 3.0,    # Per log2(1 + stars)
+    "forks": 2.0,    # Per log2(1 + forks)
+    "recency": 4.0,  # For a push today, decaying with the half-life
+    "topic": 2.0,    # Per topic in FEATURED_TOPICS
+}
+FEATURED_TOPICS = ["coder", "terraform", "kasm", "devcontainers", "home-assistant"]
+
+# Projects that get their own contribution stats (see compile_repo_patterns).
+# Exact "owner/name", whole orgs "owner/*" or name prefixes "owner/prefix*".
+TRACKED_REPOS = [
+    REGISTRY_REPO,
+]
+
 # Ensure data directory exists
 DATA_DIR.mkdir(exist_ok=True)
 
 
-def fetch_github_data() -> Dict[str, Any]:
-    """Fetch comprehensive GitHub data for the user."""
+def github_headers(token: Optional[str] = None) -> Dict[str, str]:
+    """Build GitHub API request headers."""
     headers = {"Accept": "application/vnd.github.v3+json"}
-    if GITHUB_TOKEN:
-        headers["Authorization"] = f"token {GITHUB_TOKEN}"
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
+
+def github_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    GET a GitHub API path and return the decoded JSON body.
     
+    Each request uses the TOKEN_POOL token with the most quota left. If a
+    token turns out to be rate limited, the request is retried with the
+    next best one.
+    """
+    resource = resource_for_path(path)
+    for _ in range(max(len(TOKEN_POOL), 1)):
+        token = TOKEN_POOL.acquire(resource)
+        response = requests.get(f"{GITHUB_API}{path}", headers=github_headers(token), params=params)
+        TOKEN_POOL.update(token, response.headers, response.status_code)
+        if response.status_code not in (403, 429) or not TOKEN_POOL.is_exhausted(token, resource):
+            break
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_user() -> Dict[str, Any]:
+    """Fetch the user's profile."""
     print("Fetching GitHub user data...")
-    user_response = requests.get(
-        f"https://api.github.com/users/{GITHUB_USERNAME}",
-        headers=headers
-    )
-    user_data = user_response.json()
-    
+    return github_get(f"/users/{GITHUB_USERNAME}")
+
+
+def fetch_repos() -> List[Dict[str, Any]]:
+    """Fetch the user's repositories, most recently updated first."""
     print("Fetching repositories...")
-    repos_response = requests.get(
-        f"https://api.github.com/users/{GITHUB_USERNAME}/repos?sort=updated&per_page=100",
-        headers=headers
+    return github_get(
+        f"/users/{GITHUB_USERNAME}/repos",
+        {"sort": "updated", "per_page": 100}
     )
-    repos = repos_response.json()
-    
+
+
+def fetch_events() -> List[Dict[str, Any]]:
+    """Fetch the user's public events feed."""
     print("Fetching recent activity...")
-    events_response = requests.get(
-        f"https://api.github.com/users/{GITHUB_USERNAME}/events/public?per_page=100",
-        headers=headers
+    return github_get(
+        f"/users/{GITHUB_USERNAME}/events/public",
+        {"per_page": 100}
     )
-    events = events_response.json()
-    
+
+
+def fetch_github_data() -> Dict[str, Any]:
+    """Fetch comprehensive GitHub data for the user."""
     return {
-        "user": user_data,
-        "repos": repos,
-        "events": events,
+        "user": fetch_user(),
+        "repos": fetch_repos(),
+        "events": fetch_events(),
         "fetched_at": datetime.utcnow().isoformat()
     }
 
 
-def get_coder_registry_stats(repos: List[Dict], events: List[Dict]) -> Dict[str, Any]:
-    """Extract Coder Registry specific contributions."""
-    print("Analyzing Coder Registry contributions...")
+RESOURCE_FETCHERS = {
+    "user": fetch_user,
+    "repos": fetch_repos,
+    "events": fetch_events,
+}
+
+
+def load_fetch_cache(raw_file: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load previous responses and their fetch times from data/github_data.json.
+    
+    Returns:
+        Dict mapping resource name to {"data", "fetched_at"}; resources
+        without a recorded fetch time are left out
+    """
+    try:
+        with open(raw_file or DATA_DIR / "github_data.json", "r") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    return {
+        resource: {"data": raw[resource], "fetched_at": fetched_at}
+        for resource, fetched_at in (raw.get("fetched") or {}).items()
+        if resource in raw
+    }
+
+
+def fetch_resource(
+    resource: str,
+    cached: Optional[Dict[str, Any]] = None,
+    ttl: Optional[float] = None,
+    force: bool = False,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Return a resource from the cache if it's fresh, otherwise fetch it.
+    
+    Args:
+        resource: Key of RESOURCE_FETCHERS ("user", "repos" or "events")
+        cached: Previous {"data", "fetched_at"} for this resource, if any
+        ttl: Seconds a cached copy stays fresh (default: RESOURCE_TTLS)
+        force: Fetch even if the cached copy is fresh
+        now: Reference time (default: current UTC time)
+    
+    Returns:
+        Dict with "data", "fetched_at" (ISO timestamp), "source" ("cache"
+        or "api") and "age" in seconds of the data returned
+    """
+    ttl = RESOURCE_TTLS.get(resource, 0) if ttl is None else ttl
+    now = now or datetime.now(timezone.utc)
+    
+    if cached and not force:
+        try:
+            age = (now - datetime.fromisoformat(cached["fetched_at"])).total_seconds()
+        except (ValueError, TypeError):
+            age = None
+        if age is not None and 0 <= age < ttl:
+            return {"data": cached["data"], "fetched_at": cached["fetched_at"],
+                    "source": "cache", "age": age}
+    
+    return {"data": RESOURCE_FETCHERS[resource](), "fetched_at": now.isoformat(),
+            "source": "api", "age": 0.0}
+
+
+def describe_freshness(resource: str, result: Dict[str, Any]) -> str:
+    """One-line report of where a resource came from."""
+    if result["source"] == "cache":
+        ttl = RESOURCE_TTLS.get(resource, 0)
+        return (f"⚡ {resource}: from cache ({result['age'] / 3600:.1f}h old, "
+                f"TTL {ttl / 3600:.0f}h)")
+    return f"📡 {resource}: fetched from API"
+
+
+def search_all(endpoint: str, query: str) -> List[Dict[str, Any]]:
+    """
+    Fetch every result of a GitHub search query.
+    
+    The first page tells us total_count, so the remaining pages are known
+    up front and fetched concurrently instead of following next links one
+    at a time. GitHub caps each query at 1000 results.
+    
+    Args:
+        endpoint: Search endpoint ("issues" or "commits")
+        query: Search query string
+    
+    Returns:
+        All result items, in the order GitHub returned them
+    """
+    def fetch_page(page: int) -> Dict[str, Any]:
+        return github_get(f"/search/{endpoint}", {
+            "q": query,
+            "per_page": SEARCH_PAGE_SIZE,
+            "page": page,
+            "sort": "updated" if endpoint == "issues" else "committer-date",
+            "order": "desc",
+        })
+    
+    first = fetch_page(1)
+    items = list(first.get("items", []))
+    total = first.get("total_count", 0)
+    
+    if total > SEARCH_MAX_RESULTS:
+        print(f"  ⚠️  {total} results for '{query}', only the first {SEARCH_MAX_RESULTS} are reachable")
+    
+    pages = math.ceil(min(total, SEARCH_MAX_RESULTS) / SEARCH_PAGE_SIZE)
+    if pages > 1:
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+            for result in pool.map(fetch_page, range(2, pages + 1)):
+                items.extend(result.get("items", []))
+    
+    return items
+
+
+def load_registry_index(index_file: Path = REGISTRY_INDEX_FILE) -> Optional[Dict[str, Any]]:
+    """Load the contribution index, or None if it hasn't been built yet."""
+    try:
+        with open(index_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def backfill_registry_index(
+    repo: str = REGISTRY_REPO,
+    author: str = GITHUB_USERNAME,
+    index: Optional[Dict[str, Any]] = None,
+    index_file: Path = REGISTRY_INDEX_FILE,
+) -> Dict[str, Any]:
+    """
+    Build or refresh the full contribution index for a repository.
+    
+    The public events feed only covers the last 90 days (and 100 events),
+    so PRs, issues and commits are collected through the search API instead.
+    With an existing index only items updated since the last sync are
+    fetched and merged in.
     
-    # Find coder/registry related activity
-    registry_prs = []
-    registry_commits = []
-    registry_issues = []
+    Args:
+        repo: Repository to index ("owner/name")
+        author: GitHub username whose contributions are indexed
+        index: Existing index to refresh; None rebuilds from scratch
+        index_file: Where to save the index
+    
+    Returns:
+        The updated index
+    """
+    synced_at = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    if index and index.get("repo") == repo and index.get("author") == author:
+        since = index["synced_at"]
+        print(f"Refreshing {repo} contribution index (updated since {since})...")
+        issue_filter = f" updated:>={since}"
+        commit_filter = f" committer-date:>={since}"
+    else:
+        print(f"Backfilling {repo} contribution index...")
+        index = {"repo": repo, "author": author, "prs": {}, "issues": {}, "commits": {}}
+        issue_filter = ""
+        commit_filter = ""
+    
+    for kind in ("pr", "issue"):
+        query = f"is:{kind} author:{author} repo:{repo}{issue_filter}"
+        for item in search_all("issues", query):
+            entry = {
+                "title": item.get("title", ""),
+                "number": item.get("number", ""),
+                "state": item.get("state", ""),
+                "url": item.get("html_url", ""),
+                "created_at": item.get("created_at", ""),
+                "updated_at": item.get("updated_at", ""),
+            }
+            if kind == "pr":
+                entry["merged"] = bool((item.get("pull_request") or {}).get("merged_at"))
+            index[f"{kind}s"][str(item.get("number"))] = entry
+    
+    query = f"author:{author} repo:{repo}{commit_filter}"
+    for item in search_all("commits", query):
+        commit = item.get("commit", {})
+        index["commits"][item.get("sha", "")] = {
+            "message": commit.get("message", "").split("\n")[0],
+            "sha": item.get("sha", "")[:7],
+            "url": item.get("html_url", ""),
+            "created_at": (commit.get("committer") or {}).get("date", ""),
+        }
+    
+    index["synced_at"] = synced_at
+    
+    with open(index_file, "w") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    
+    print(f"   - {len(index['prs'])} PRs, {len(index['issues'])} issues, "
+          f"{len(index['commits'])} commits indexed")
+    return index
+
+
+def compile_repo_patterns(patterns: List[str]) -> Dict[str, Any]:
+    """
+    Compile tracked-repository patterns into lookup tables.
+    
+    Supported patterns (matched case-insensitively, like GitHub names):
+        "owner/name"    exact repository
+        "owner/*"       every repository in an org
+        "owner/prefix*" repositories whose name starts with prefix
+    
+    Exact names go into a set-like dict and prefixes are indexed per owner by
+    length, so classifying a repo never scans the pattern list.
+    
+    Returns:
+        Matcher dict for match_repo()
+    """
+    matcher = {"exact": {}, "orgs": {}, "prefixes": {}, "prefix_lengths": {}}
+    
+    for pattern in patterns:
+        owner, _, name = pattern.lower().partition("/")
+        if not name:
+            raise ValueError(f"Tracked repo pattern must look like owner/name: {pattern!r}")
+        
+        if name == "*":
+            matcher["orgs"].setdefault(owner, pattern)
+        elif name.endswith("*"):
+            prefix = name[:-1]
+            if "*" in prefix:
+                raise ValueError(f"Only a trailing * is supported: {pattern!r}")
+            matcher["prefixes"].setdefault(owner, {}).setdefault(prefix, pattern)
+        elif "*" in name:
+            raise ValueError(f"Only a trailing * is supported: {pattern!r}")
+        else:
+            matcher["exact"].setdefault(f"{owner}/{name}", pattern)
+    
+    # Longest prefix wins, so try lengths from longest to shortest
+    for owner, prefixes in matcher["prefixes"].items():
+        matcher["prefix_lengths"][owner] = sorted({len(p) for p in prefixes}, reverse=True)
+    
+    return matcher
+
+
+def match_repo(matcher: Dict[str, Any], repo_name: str) -> Optional[str]:
+    """
+    Find the tracked pattern a repository belongs to.
+    
+    Precedence is exact name, then longest prefix, then org wildcard.
+    
+    Returns:
+        The matching pattern as configured, or None if untracked
+    """
+    repo_name = repo_name.lower()
+    
+    pattern = matcher["exact"].get(repo_name)
+    if pattern:
+        return pattern
+    
+    owner, _, name = repo_name.partition("/")
+    prefixes = matcher["prefixes"].get(owner)
+    if prefixes:
+        for length in matcher["prefix_lengths"][owner]:
+            pattern = prefixes.get(name[:length])
+            if pattern:
+                return pattern
+    
+    return matcher["orgs"].get(owner)
+
+
+def summarize_contributions(events: List[Dict]) -> Dict[str, Any]:
+    """Summarize PRs, commits and issues from a list of events."""
+    prs = []
+    commits = []
+    issues = []
     
     for event in events:
-        repo_name = event.get("repo", {}).get("name", "")
+        event_type = event.get("type", "")
+        payload = event.get("payload", {})
+        created_at = event.get("created_at", "")
         
-        if "coder/registry" in repo_name:
-            event_type = event.get("type", "")
-            payload = event.get("payload", {})
-            created_at = event.get("created_at", "")
-            
-            if event_type == "PullRequestEvent":
-                pr = payload.get("pull_request", {})
-                registry_prs.append({
-                    "action": payload.get("action", ""),
-                    "title": pr.get("title", ""),
-                    "number": pr.get("number", ""),
-                    "state": pr.get("state", ""),
-                    "url": pr.get("html_url", ""),
-                    "created_at": created_at
-                })
-            
-            elif event_type == "PushEvent":
-                commits = payload.get("commits", [])
-                for commit in commits:
-                    registry_commits.append({
-                        "message": commit.get("message", ""),
-                        "sha": commit.get("sha", "")[:7],
-                        "created_at": created_at
-                    })
-            
-            elif event_type == "IssuesEvent":
-                issue = payload.get("issue", {})
-                registry_issues.append({
-                    "action": payload.get("action", ""),
-                    "title": issue.get("title", ""),
-                    "number": issue.get("number", ""),
-                    "url": issue.get("html_url", ""),
+        if event_type == "PullRequestEvent":
+            pr = payload.get("pull_request", {})
+            prs.append({
+                "action": payload.get("action", ""),
+                "title": pr.get("title", ""),
+                "number": pr.get("number", ""),
+                "state": pr.get("state", ""),
+                "url": pr.get("html_url", ""),
+                "created_at": created_at
+            })
+        
+        elif event_type == "PushEvent":
+            for commit in payload.get("commits", []):
+                commits.append({
+                    "message": commit.get("message", ""),
+                    "sha": commit.get("sha", "")[:7],
                     "created_at": created_at
                 })
+        
+        elif event_type == "IssuesEvent":
+            issue = payload.get("issue", {})
+            issues.append({
+                "action": payload.get("action", ""),
+                "title": issue.get("title", ""),
+                "number": issue.get("number", ""),
+                "url": issue.get("html_url", ""),
+                "created_at": created_at
+            })
+    
+    return {
+        "prs": prs[:5],  # Latest 5 PRs
+        "commits": commits[:10],  # Latest 10 commits
+        "issues": issues[:5],  # Latest 5 issues
+        "total_prs": len(prs),
+        "total_commits": len(commits),
+        "total_issues": len(issues)
+    }
+
+
+def get_tracked_repo_stats(
+    events: List[Dict],
+    patterns: List[str] = None,
+    indexes: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract contribution stats for every tracked project.
+    
+    Each event is classified once against the compiled patterns. Projects
+    with a search-API contribution index use that instead of the events feed,
+    since the feed only sees the last 90 days of activity.
+    
+    Args:
+        events: Public events feed
+        patterns: Tracked repo patterns (default: TRACKED_REPOS)
+        indexes: Contribution indexes keyed by pattern
+    
+    Returns:
+        Dict mapping each pattern to stats shaped like coder_stats
+    """
+    print("Analyzing tracked project contributions...")
+    
+    if patterns is None:
+        patterns = TRACKED_REPOS
+    indexes = indexes or {}
+    matcher = compile_repo_patterns(patterns)
+    
+    buckets = {pattern: [] for pattern in patterns}
+    for event in events:
+        pattern = match_repo(matcher, event.get("repo", {}).get("name", ""))
+        if pattern:
+            buckets[pattern].append(event)
+    
+    return {
+        pattern: get_index_stats(indexes[pattern]) if indexes.get(pattern)
+        else summarize_contributions(project_events)
+        for pattern, project_events in buckets.items()
+    }
+
+
+def get_coder_registry_stats(
+    repos: List[Dict],
+    events: List[Dict],
+    index: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Extract Coder Registry specific contributions."""
+    indexes = {REGISTRY_REPO: index} if index else None
+    return get_tracked_repo_stats(events, [REGISTRY_REPO], indexes)[REGISTRY_REPO]
+
+
+def get_index_stats(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a contribution index in the same shape as the event-based stats."""
+    def newest_first(items: Dict[str, Dict]) -> List[Dict]:
+        return sorted(items.values(), key=lambda item: item.get("created_at", ""), reverse=True)
+    
+    prs = newest_first(index.get("prs", {}))
+    commits = newest_first(index.get("commits", {}))
+    issues = newest_first(index.get("issues", {}))
     
     return {
-        "prs": registry_prs[:5],  # Latest 5 PRs
-        "commits": registry_commits[:10],  # Latest 10 commits
-        "issues": registry_issues[:5],  # Latest 5 issues
-        "total_prs": len(registry_prs),
-        "total_commits": len(registry_commits),
-        "total_issues": len(registry_issues)
+        "prs": prs[:5],
+        "commits": commits[:10],
+        "issues": issues[:5],
+        "total_prs": len(prs),
+        "total_commits": len(commits),
+        "total_issues": len(issues)
     }
 
 
@@ -176,89 +584,300 @@ def get_all_languages_comprehensive(repos: List[Dict]) -> List[str]:
     return sorted(list(all_languages))
 
 
-def get_recent_activity(events: List[Dict]) -> List[Dict[str, str]]:
-    """Get recent meaningful activity."""
+def score_repo(
+    repo: Dict[str, Any],
+    now: datetime,
+    weights: Dict[str, float],
+    topics: set,
+    half_life_days: float
+) -> float:
+    """Score a repo by stars and forks (log scaled), push recency and topic matches."""
+    try:
+        pushed = datetime.fromisoformat(repo["pushed_at"].replace("Z", "+00:00"))
+        recency = 0.5 ** (max((now - pushed).total_seconds(), 0) / 86400 / half_life_days)
+    except (KeyError, AttributeError, ValueError, TypeError):
+        recency = 0.0
+    matches = len(topics.intersection(repo.get("topics") or []))
+    return (
+        weights.get("stars", 0.0) * math.log2(1 + (repo.get("stargazers_count") or 0))
+        + weights.get("forks", 0.0) * math.log2(1 + (repo.get("forks_count") or 0))
+        + weights.get("recency", 0.0) * recency
+        + weights.get("topic", 0.0) * matches
+    )
+
+
+def build_repo_index(repos: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Build an inverted index from topic and language to repo names.
+    
+    Returns:
+        {"topics": {topic: [names]}, "languages": {language: [names]}},
+        each list in the order the repos were given
+    """
+    index = {"topics": {}, "languages": {}}
+    for repo in repos:
+        name = repo.get("name", "")
+        for topic in repo.get("topics") or []:
+            index["topics"].setdefault(topic, []).append(name)
+        if repo.get("language"):
+            index["languages"].setdefault(repo["language"], []).append(name)
+    return index
+
+
+def get_featured_repos(
+    repos: List[Dict],
+    limit: int = None,
+    weights: Optional[Dict[str, float]] = None,
+    topics: Optional[List[str]] = None,
+    half_life_days: float = None,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Rank the user's own repositories for a "featured projects" section.
+    
+    Forks, archived repos and the profile README repo are skipped. Every
+    candidate is scored once and the best `limit` are picked with a heap
+    (heapq.nlargest) instead of sorting the whole list.
+    
+    Args:
+        repos: Repositories from the API
+        limit: Number of repos to feature (default: FEATURED_LIMIT)
+        weights: Score weights (default: FEATURED_WEIGHTS)
+        topics: Topics that earn a bonus (default: FEATURED_TOPICS)
+        half_life_days: Age of last push at which the recency bonus halves
+            (default: FEATURED_HALF_LIFE_DAYS)
+        now: Reference time for recency (default: current UTC time)
+    
+    Returns:
+        Dict with "featured" (best first) and "index", the inverted
+        topic/language index over all candidate repos
+    """
+    print("Ranking featured repositories...")
+    
+    limit = FEATURED_LIMIT if limit is None else limit
+    weights = FEATURED_WEIGHTS if weights is None else weights
+    topics = set(FEATURED_TOPICS if topics is None else topics)
+    half_life_days = FEATURED_HALF_LIFE_DAYS if half_life_days is None else half_life_days
+    now = now or datetime.now(timezone.utc)
+    
+    candidates = [
+        repo for repo in repos
+        if not repo.get("fork") and not repo.get("archived")
+        and repo.get("name", "").lower() != GITHUB_USERNAME.lower()
+    ]
+    scored = [(score_repo(repo, now, weights, topics, half_life_days), repo) for repo in candidates]
+    best = heapq.nlargest(max(limit, 0), scored, key=lambda entry: entry[0])
+    
+    return {
+        "featured": [
+            {
+                "name": repo.get("name"),
+                "description": repo.get("description") or "",
+                "url": repo.get("html_url"),
+                "language": repo.get("language"),
+                "topics": repo.get("topics") or [],
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),
+                "pushed_at": repo.get("pushed_at"),
+                "score": round(score, 2),
+            }
+            for score, repo in best
+        ],
+        "index": build_repo_index(candidates),
+    }
+
+
+def describe_event(event: Dict) -> Optional[Dict[str, Any]]:
+    """
+    Turn a single event into an activity item, or None if it isn't meaningful.
+    
+    The "kind" field selects the ACTIVITY_WEIGHTS entry used for ranking.
+    """
+    event_type = event.get("type", "")
+    repo_name = event.get("repo", {}).get("name", "")
+    created_at = event.get("created_at", "")
+    payload = event.get("payload", {})
+    
+    if event_type == "PushEvent":
+        # Newer feeds drop the commit list and size from push payloads
+        # (only before/head remain), so the commit count may be unknown
+        commits = len(payload.get("commits") or []) or payload.get("size") or None
+        return {
+            "kind": "push",
+            "type": "push",
+            "icon": "📝",
+            "repo": repo_name,
+            "pushes": 1,
+            "commits": commits,
+            "date": created_at
+        }
+    
+    if event_type == "PullRequestEvent":
+        pr = payload.get("pull_request", {})
+        action = payload.get("action", "")
+        if action not in ["opened", "closed", "merged"]:
+            return None
+        status = "merged" if action == "merged" or pr.get("merged", False) else action
+        number = pr.get("number") or payload.get("number", "")
+        title = pr.get("title") or f"#{number}"
+        return {
+            "kind": f"pr_{status}",
+            "type": "pr",
+            "icon": "🔀" if status == "merged" else "🎯",
+            "description": f"Pull Request {status}: {title} in {repo_name}",
+            "date": created_at,
+            "url": pr.get("html_url") or f"https://github.com/{repo_name}/pull/{number}"
+        }
+    
+    if event_type == "IssuesEvent":
+        issue = payload.get("issue", {})
+        action = payload.get("action", "")
+        if action not in ["opened", "closed"]:
+            return None
+        return {
+            "kind": f"issue_{action}",
+            "type": "issue",
+            "icon": "🐛" if action == "opened" else "✅",
+            "description": f"Issue {action}: {issue.get('title', '')} in {repo_name}",
+            "date": created_at,
+            "url": issue.get("html_url", "")
+        }
+    
+    if event_type == "CreateEvent":
+        ref_type = payload.get("ref_type", "")
+        if ref_type not in ["repository", "branch", "tag"]:
+            return None
+        return {
+            "kind": "create",
+            "type": "create",
+            "icon": "🎉",
+            "description": f"Created {ref_type} in {repo_name}",
+            "date": created_at
+        }
+    
+    if event_type == "ReleaseEvent":
+        release = payload.get("release", {})
+        return {
+            "kind": "release",
+            "type": "release",
+            "icon": "🚀",
+            "description": f"Released {release.get('tag_name', '')} in {repo_name}",
+            "date": created_at,
+            "url": release.get("html_url", "")
+        }
+    
+    return None
+
+
+def score_activity(
+    item: Dict[str, Any],
+    now: datetime,
+    weights: Dict[str, float],
+    half_life_hours: float
+) -> float:
+    """Score an activity item by its type weight, halved every half-life of age."""
+    try:
+        date = datetime.fromisoformat(item["date"].replace("Z", "+00:00"))
+        age_hours = max((now - date).total_seconds() / 3600, 0)
+    except (ValueError, TypeError):
+        age_hours = half_life_hours * 10  # Undated items sink to the bottom
+    return weights.get(item["kind"], 0.0) * 0.5 ** (age_hours / half_life_hours)
+
+
+def get_recent_activity(
+    events: List[Dict],
+    limit: int = None,
+    weights: Optional[Dict[str, float]] = None,
+    half_life_hours: float = None,
+    now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get the top recent meaningful activity.
+    
+    Consecutive pushes to the same repo are coalesced into one item with a
+    push count (and a commit count when every push reports one), so a
+    burst of pushes can't crowd out everything else.
+    Items are scored by type and recency, and the best `limit` are kept in
+    a bounded min-heap during a single pass over the feed.
+    
+    Args:
+        events: Public events feed (newest first)
+        limit: Number of items to return (default: ACTIVITY_LIMIT)
+        weights: Score per activity kind (default: ACTIVITY_WEIGHTS)
+        half_life_hours: Age at which a score halves (default: ACTIVITY_HALF_LIFE_HOURS)
+        now: Reference time for recency (default: current UTC time)
+    
+    Returns:
+        Activity items, highest score first
+    """
     print("Processing recent activity...")
     
-    activity = []
-    seen_events = set()
+    limit = ACTIVITY_LIMIT if limit is None else limit
+    weights = ACTIVITY_WEIGHTS if weights is None else weights
+    half_life_hours = ACTIVITY_HALF_LIFE_HOURS if half_life_hours is None else half_life_hours
+    now = now or datetime.now(timezone.utc)
+    
+    if limit <= 0:
+        return []
+    
+    heap = []  # (score, -position, item): min-heap, older items lose ties
+    position = 0
+    seen_ids = set()
+    pending_push = None
+    
+    def offer(item: Dict[str, Any]) -> None:
+        nonlocal position
+        if item["kind"] == "push":
+            if item["commits"] is not None:
+                item["description"] = f"Pushed {item['commits']} commit(s) to {item['repo']}"
+            else:
+                noun = "push" if item["pushes"] == 1 else "pushes"
+                item["description"] = f"{item['pushes']} {noun} to {item['repo']}"
+        entry = (score_activity(item, now, weights, half_life_hours), -position, item)
+        position += 1
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
     
     for event in events:
-        event_type = event.get("type", "")
-        repo_name = event.get("repo", {}).get("name", "")
-        created_at = event.get("created_at", "")
-        payload = event.get("payload", {})
+        event_id = event.get("id")
+        if event_id is not None:
+            if event_id in seen_ids:
+                continue
+            seen_ids.add(event_id)
         
-        # Create a unique key to avoid duplicates
-        event_key = f"{event_type}_{repo_name}_{created_at}"
-        if event_key in seen_events:
+        item = describe_event(event)
+        if not item:
             continue
-        seen_events.add(event_key)
-        
-        activity_item = None
-        
-        if event_type == "PushEvent":
-            commits = payload.get("commits", [])
-            if commits:
-                activity_item = {
-                    "type": "push",
-                    "icon": "📝",
-                    "description": f"Pushed {len(commits)} commit(s) to {repo_name}",
-                    "date": created_at
-                }
-        
-        elif event_type == "PullRequestEvent":
-            pr = payload.get("pull_request", {})
-            action = payload.get("action", "")
-            if action in ["opened", "closed"]:
-                status = "merged" if pr.get("merged", False) else action
-                activity_item = {
-                    "type": "pr",
-                    "icon": "🔀" if status == "merged" else "🎯",
-                    "description": f"Pull Request {status}: {pr.get('title', '')} in {repo_name}",
-                    "date": created_at,
-                    "url": pr.get("html_url", "")
-                }
-        
-        elif event_type == "IssuesEvent":
-            issue = payload.get("issue", {})
-            action = payload.get("action", "")
-            if action in ["opened", "closed"]:
-                activity_item = {
-                    "type": "issue",
-                    "icon": "🐛" if action == "opened" else "✅",
-                    "description": f"Issue {action}: {issue.get('title', '')} in {repo_name}",
-                    "date": created_at,
-                    "url": issue.get("html_url", "")
-                }
         
-        elif event_type == "CreateEvent":
-            ref_type = payload.get("ref_type", "")
-            if ref_type in ["repository", "branch", "tag"]:
-                activity_item = {
-                    "type": "create",
-                    "icon": "🎉",
-                    "description": f"Created {ref_type} in {repo_name}",
-                    "date": created_at
-                }
-        
-        elif event_type == "ReleaseEvent":
-            release = payload.get("release", {})
-            activity_item = {
-                "type": "release",
-                "icon": "🚀",
-                "description": f"Released {release.get('tag_name', '')} in {repo_name}",
-                "date": created_at,
-                "url": release.get("html_url", "")
-            }
+        if item["kind"] == "push":
+            if pending_push and pending_push["repo"] == item["repo"]:
+                # Keeps the newest push's date; one unknown count makes the total unknown
+                pending_push["pushes"] += 1
+                if pending_push["commits"] is not None and item["commits"] is not None:
+                    pending_push["commits"] += item["commits"]
+                else:
+                    pending_push["commits"] = None
+                continue
+            if pending_push:
+                offer(pending_push)
+            pending_push = item
+            continue
         
-        if activity_item:
-            activity.append(activity_item)
-            
-            if len(activity) >= 10:  # Limit to 10 activities
-                break
+        if pending_push:
+            offer(pending_push)
+            pending_push = None
+        offer(item)
+    
+    if pending_push:
+        offer(pending_push)
     
-    return activity
+    ranked = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+    return [
+        {key: value for key, value in item.items() if key not in ("kind", "repo")}
+        for _, _, item in ranked
+    ]
 
 
 def format_date(date_str: str) -> str:
@@ -325,28 +944,33 @@ Use the provided data to create an informative and visually appealing README.
 """
 
 
-def generate_readme(github_data: Dict[str, Any]) -> str:
+def update_registry_index(backfill: bool = False) -> Optional[Dict[str, Any]]:
     """
-    Generate README data for AI to use.
+    Backfill the contribution index, or refresh it if it already exists.
     
-    This function now focuses on preparing clean data for the AI to use
-    when crafting the actual README. The AI has creative freedom to
-    format and present this information in an engaging way.
+    Returns:
+        The index, or None if it was never built and backfill is False
     """
-    print("Preparing README data for AI generation...")
-    
-    user = github_data["user"]
-    repos = github_data["repos"]
-    events = github_data["events"]
-    
-    # Extract statistics
-    coder_stats = get_coder_registry_stats(repos, events)
-    language_stats = get_language_stats(repos)
-    all_languages = get_all_languages_comprehensive(repos)
-    recent_activity = get_recent_activity(events)
-    
-    # Save comprehensive data for AI to use
-    readme_data = {
+    registry_index = load_registry_index(REGISTRY_INDEX_FILE)
+    if not (backfill or registry_index):
+        return None
+    return backfill_registry_index(
+        index=None if backfill else registry_index,
+        index_file=REGISTRY_INDEX_FILE
+    )
+
+
+def build_readme_data(
+    user: Dict[str, Any],
+    tracked_stats: Dict[str, Dict[str, Any]],
+    language_stats: Dict[str, int],
+    all_languages: List[str],
+    recent_activity: List[Dict[str, Any]],
+    featured_repos: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Assemble github_stats.json from the analyzer outputs (without updated_at)."""
+    featured_repos = featured_repos or {"featured": [], "index": {"topics": {}, "languages": {}}}
+    return {
         "user": {
             "username": user.get("login"),
             "name": user.get("name"),
@@ -355,7 +979,8 @@ def generate_readme(github_data: Dict[str, Any]) -> str:
             "followers": user.get("followers"),
             "following": user.get("following"),
         },
-        "coder_stats": coder_stats,
+        "coder_stats": tracked_stats.get(REGISTRY_REPO) or summarize_contributions([]),
+        "tracked_projects": tracked_stats,  # Per-project stats, same shape as coder_stats
         "languages": {
             "by_repo_count": language_stats,  # Languages sorted by how many repos use them
             "all_detected": all_languages,     # ALL languages found (comprehensive list)
@@ -363,24 +988,46 @@ def generate_readme(github_data: Dict[str, Any]) -> str:
             "total_count": len(all_languages)
         },
         "recent_activity": recent_activity,
-        "updated_at": datetime.utcnow().isoformat(),
+        "featured_repos": featured_repos["featured"],  # Best first, see get_featured_repos
+        "repo_index": featured_repos["index"],         # topic/language -> repo names
         "instructions": {
             "note": "Use constants.py helpers for all badges - they guarantee working URLs",
             "guidelines": "Read scripts/ai_guidelines.md for styling and creative patterns",
             "social_links": "Defined in constants.USER_SOCIAL_LINKS",
             "tech_reference": "Use constants.COMMON_TECH for icon slugs and colors",
-            "all_languages_available": "languages.all_detected has EVERY language detected"
+            "all_languages_available": "languages.all_detected has EVERY language detected",
+            "featured_repos": "Ranked repos for a projects section; filter with repo_index"
         }
     }
+
+
+def write_readme_data(
+    readme_data: Dict[str, Any],
+    digest_budget: int = DIGEST_BUDGET_CHARS
+) -> str:
+    """
+    Save github_stats.json, the AI digest and the section manifest.
+    
+    Returns:
+        Status message for the AI generation step
+    """
+    readme_data = dict(readme_data, updated_at=datetime.utcnow().isoformat())
+    coder_stats = readme_data["coder_stats"]
+    top_languages = list(readme_data["languages"]["by_repo_count"])[:5]
+    recent_activity = readme_data["recent_activity"]
     
     with open(DATA_DIR / "github_stats.json", "w") as f:
         json.dump(readme_data, f, indent=2)
     
     print(f"✅ Data saved to {DATA_DIR / 'github_stats.json'}")
+    digest = write_digest(readme_data, digest_budget, DATA_DIR / "ai_digest.md")
+    manifest = section_cache.plan(
+        readme_data, DATA_DIR / "section_cache.json", DATA_DIR / "section_manifest.json"
+    )
     print(f"   - {coder_stats['total_prs']} Coder Registry PRs")
     print(f"   - {len(recent_activity)} recent activities")
-    print(f"   - {len(all_languages)} total languages detected")
-    print(f"   - Top languages: {', '.join(list(language_stats.keys())[:5])}")
+    print(f"   - {readme_data['languages']['total_count']} total languages detected")
+    print(f"   - Top languages: {', '.join(top_languages)}")
     print("\n🎨 AI can now generate README with this data!")
     
     # Return a simple confirmation instead of a full README
@@ -391,15 +1038,18 @@ The GitHub stats have been saved to `data/github_stats.json`.
 
 ## Summary:
 - **Coder Registry**: {coder_stats['total_prs']} PRs, {coder_stats['total_commits']} commits
-- **Languages**: {', '.join(list(language_stats.keys())[:5])}
+- **Languages**: {', '.join(top_languages)}
 - **Recent Activity**: {len(recent_activity)} events
 
 ## Next Steps:
-The AI should now read `data/github_stats.json` and create an engaging README.md file.
+The AI should now read `data/ai_digest.md` (~{digest['tokens']} tokens) and create an engaging README.md file.
+Full data is in `data/github_stats.json` if something is missing from the digest.
+Only these sections need regenerating: {', '.join(manifest['regenerate']) or 'none'}
+(see `data/section_manifest.json`; reuse the cached markdown for the rest).
 
 ## Guidelines:
-- Use helpers from `scripts/constants.py` for all badges
-- Read `scripts/ai_guidelines.md` for creative patterns
+- Use the precomputed badges from the digest (built with `scripts/constants.py` helpers)
+- Follow the guideline excerpts in the digest (from `scripts/ai_guidelines.md`)
 - Make it visually appealing and not generic
 - Highlight Coder Registry work prominently
 - Show personality!
@@ -408,31 +1058,238 @@ Generated at: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}
 """
 
 
-def main():
+def generate_readme(
+    github_data: Dict[str, Any],
+    registry_index: Optional[Dict[str, Any]] = None,
+    digest_budget: int = DIGEST_BUDGET_CHARS
+) -> str:
+    """
+    Generate README data for AI to use.
+    
+    This function now focuses on preparing clean data for the AI to use
+    when crafting the actual README. The AI has creative freedom to
+    format and present this information in an engaging way.
+    
+    This runs every analyzer in sequence; main() runs the same steps as a
+    cached, concurrent pipeline (see build_pipeline).
+    """
+    print("Preparing README data for AI generation...")
+    
+    repos = github_data["repos"]
+    events = github_data["events"]
+    
+    readme_data = build_readme_data(
+        github_data["user"],
+        get_tracked_repo_stats(
+            events, TRACKED_REPOS, {REGISTRY_REPO: registry_index} if registry_index else None
+        ),
+        get_language_stats(repos),
+        get_all_languages_comprehensive(repos),
+        get_recent_activity(events),
+        get_featured_repos(repos)
+    )
+    return write_readme_data(readme_data, digest_budget)
+
+
+def save_raw_data(
+    user: Dict[str, Any],
+    repos: List[Dict],
+    events: List[Dict],
+    fetched: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    Save the raw API responses to data/github_data.json for reference.
+    
+    "fetched" records when each resource was last fetched from the API,
+    which is what load_fetch_cache uses to decide what is still fresh.
+    """
+    print("💾 Saving raw data...")
+    github_data = {
+        "user": user,
+        "repos": repos,
+        "events": events,
+        "fetched_at": datetime.utcnow().isoformat(),
+        "fetched": fetched or {}
+    }
+    with open(DATA_DIR / "github_data.json", "w") as f:
+        json.dump(github_data, f, indent=2)
+
+
+def build_pipeline(
+    backfill: bool = False,
+    digest_budget: int = DIGEST_BUDGET_CHARS,
+    force: bool = False
+) -> List[Stage]:
+    """
+    Describe the README data pipeline as a DAG of stages.
+    
+    Fetches run concurrently and only hit the API for resources older
+    than their RESOURCE_TTLS entry (or all of them with force). The
+    write stage reports what came from cache. The analyzers and the
+    render step are cached on their inputs, so they only rerun when the
+    fetched data, their configuration or their code changed. Activity
+    ranking is safe to cache: every score decays by the same factor over
+    time, so the order only depends on the events.
+    
+    Args:
+        backfill: Rebuild the contribution index from scratch
+        digest_budget: Maximum size of data/ai_digest.md in characters
+        force: Fetch every resource, ignoring RESOURCE_TTLS
+    
+    Returns:
+        Stages for pipeline.run_pipeline
+    """
+    fetch_cache = load_fetch_cache()
+    freshness = {}  # resource -> fetch_resource result, filled in by the fetch stages
+    
+    def fetch(resource: str):
+        def run(inputs: Dict[str, Any]) -> Any:
+            result = fetch_resource(resource, fetch_cache.get(resource), force=force)
+            freshness[resource] = result
+            print(describe_freshness(resource, result))
+            return result["data"]
+        return run
+    
+    def registry_stats(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        index = inputs["registry_index"]
+        return get_tracked_repo_stats(
+            inputs["fetch_events"], TRACKED_REPOS, {REGISTRY_REPO: index} if index else None
+        )
+    
+    def render(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        languages = inputs["language_stats"]
+        return build_readme_data(
+            inputs["fetch_user"], inputs["registry_stats"],
+            languages["by_repo_count"], languages["all_detected"], inputs["activity"],
+            inputs["featured_repos"]
+        )
+    
+    def write(inputs: Dict[str, Any]) -> str:
+        cached = [resource for resource, result in freshness.items() if result["source"] == "cache"]
+        print(f"📦 {len(cached)} of {len(freshness)} resources served from cache"
+              + (f" ({', '.join(sorted(cached))})" if cached else ""))
+        save_raw_data(
+            inputs["fetch_user"], inputs["fetch_repos"], inputs["fetch_events"],
+            {resource: result["fetched_at"] for resource, result in freshness.items()}
+        )
+        return write_readme_data(inputs["render"], digest_budget)
+    
+    return [
+        Stage("fetch_user", fetch("user"), cache=False),
+        Stage("fetch_repos", fetch("repos"), cache=False),
+        Stage("fetch_events", fetch("events"), cache=False),
+        Stage("registry_index", lambda inputs: update_registry_index(backfill), cache=False),
+        Stage(
+            "language_stats",
+            lambda inputs: {
+                "by_repo_count": get_language_stats(inputs["fetch_repos"]),
+                "all_detected": get_all_languages_comprehensive(inputs["fetch_repos"]),
+            },
+            deps=["fetch_repos"],
+            code=[get_language_stats, get_all_languages_comprehensive],
+        ),
+        Stage(
+            "registry_stats", registry_stats,
+            deps=["fetch_events", "registry_index"],
+            code=[get_tracked_repo_stats, compile_repo_patterns, match_repo,
+                  summarize_contributions, get_index_stats],
+            params={"tracked": TRACKED_REPOS, "registry": REGISTRY_REPO},
+        ),
+        Stage(
+            "activity", lambda inputs: get_recent_activity(inputs["fetch_events"]),
+            deps=["fetch_events"],
+            code=[get_recent_activity, describe_event, score_activity],
+            params={
+                "limit": ACTIVITY_LIMIT,
+                "weights": ACTIVITY_WEIGHTS,
+                "half_life_hours": ACTIVITY_HALF_LIFE_HOURS,
+            },
+        ),
+        Stage(
+            "featured_repos", lambda inputs: get_featured_repos(inputs["fetch_repos"]),
+            deps=["fetch_repos"],
+            code=[get_featured_repos, score_repo, build_repo_index],
+            params={
+                "limit": FEATURED_LIMIT,
+                "weights": FEATURED_WEIGHTS,
+                "topics": FEATURED_TOPICS,
+                "half_life_days": FEATURED_HALF_LIFE_DAYS,
+                "username": GITHUB_USERNAME,
+                # Recency bonuses don't decay uniformly, so rescore daily
+                "date": datetime.now(timezone.utc).date().isoformat(),
+            },
+        ),
+        Stage(
+            "render", render,
+            deps=["fetch_user", "language_stats", "registry_stats", "activity", "featured_repos"],
+            code=[build_readme_data],
+        ),
+        Stage(
+            "write", write,
+            deps=["fetch_user", "fetch_repos", "fetch_events", "render"],
+            cache=False,
+        ),
+    ]
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main execution: Fetch GitHub data and prepare it for AI generation.
     
     This script now focuses on data collection, not README generation.
     The AI (Claude) will use this data to create a creative, engaging README.
     """
+    parser = argparse.ArgumentParser(description="Fetch GitHub data for README generation")
+    parser.add_argument(
+        "--backfill", action="store_true",
+        help=f"Rebuild the full {REGISTRY_REPO} contribution index from the search API"
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Serve the existing data files over HTTP instead of fetching (see stats_server.py)"
+    )
+    parser.add_argument("--host", help="Interface for --serve to bind (default: stats_server's)")
+    parser.add_argument("--port", type=int, help="Port for --serve to listen on (default: stats_server's)")
+    parser.add_argument(
+        "--digest-budget", type=int, default=DIGEST_BUDGET_CHARS,
+        help="Maximum size of data/ai_digest.md in characters"
+    )
+    parser.add_argument(
+        "--rerun-all", action="store_true",
+        help="Ignore cached pipeline stage outputs and rerun every stage"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Fetch every resource from the API, even if its cached copy is fresh"
+    )
+    args = parser.parse_args(argv)
+    
+    if args.serve:
+        import stats_server
+        serve_args = []
+        if args.host:
+            serve_args += ["--host", args.host]
+        if args.port is not None:
+            serve_args += ["--port", str(args.port)]
+        return stats_server.main(serve_args)
+    
     try:
         print("=" * 70)
         print("GitHub Data Fetcher - README Generator Helper")
         print("=" * 70)
         print()
         
-        # Fetch fresh data from GitHub
-        print("📡 Fetching GitHub data...")
-        github_data = fetch_github_data()
-        
-        # Save raw data for reference
-        print("💾 Saving raw data...")
-        with open(DATA_DIR / "github_data.json", "w") as f:
-            json.dump(github_data, f, indent=2)
-        
-        # Process and prepare data for AI
-        print("🔄 Processing statistics...")
-        status_message = generate_readme(github_data)
+        # Fetch, analyze and save as a DAG; unchanged analyzers come from cache
+        print("📡 Running data pipeline...")
+        result = run_pipeline(
+            build_pipeline(args.backfill, args.digest_budget, args.force),
+            cache_dir=DATA_DIR / ".pipeline_cache",
+            force=args.rerun_all
+        )
+        status_message = result["outputs"]["write"]
+        for quota in TOKEN_POOL.status():
+            print(f"🔑 Token {quota['token']}: {quota['remaining']:.0f} {quota['resource']} "
+                  f"requests left")
         
         print()
         print("=" * 70)
@@ -440,9 +1297,8 @@ def main():
         print("=" * 70)
         print()
         print("✨ Data ready! AI can now generate the README.")
-        print("   Read: data/github_stats.json")
-        print("   Guidelines: scripts/ai_guidelines.md")
-        print("   Helpers: scripts/constants.py")
+        print("   Read: data/ai_digest.md")
+        print("   Full data: data/github_stats.json")
         print()
         
         return 0
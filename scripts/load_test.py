@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Load-test the local stats server.
+
+Opens a number of keep-alive connections and sends requests round-robin
+over a set of paths, then reports throughput, latency percentiles and
+status codes. Half of the requests revalidate with If-None-Match by
+default, to exercise the 304 path like browsers and CDNs do.
+
+Usage:
+    python3 scripts/stats_server.py &
+    python3 scripts/load_test.py --connections 100 --requests 20000
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional
+
+# Configuration
+DEFAULT_URL = "http://127.0.0.1:8080"
+DEFAULT_PATHS = [
+    "/stats",
+    "/stats/languages",
+    "/stats/recent_activity",
+    "/card/languages.svg",
+    "/health",
+]
+
+
+async def read_response(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """Read one HTTP/1.1 response (Content-Length framed)."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    body = await reader.readexactly(int(headers.get("content-length", "0")))
+    return {"status": status, "headers": headers, "body": body}
+
+
+async def request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    host: str,
+    path: str,
+    etag: Optional[str] = None
+) -> Dict[str, Any]:
+    """Send a GET on an open connection and read the response."""
+    lines = [f"GET {path} HTTP/1.1", f"Host: {host}"]
+    if etag:
+        lines.append(f"If-None-Match: {etag}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+    return await read_response(reader)
+
+
+async def worker(
+    url: str,
+    paths: List[str],
+    count: int,
+    revalidate: float,
+    latencies: List[float],
+    statuses: Dict[int, int]
+) -> None:
+    """Send `count` requests over one keep-alive connection."""
+    target = urlparse(url)
+    reader, writer = await asyncio.open_connection(target.hostname, target.port or 80)
+    etags = {}
+    credit = 0.0
+
+    try:
+        for i in range(count):
+            path = paths[i % len(paths)]
+
+            # Revalidate a fraction of requests once we know the ETag
+            credit += revalidate
+            use_etag = None
+            if credit >= 1:
+                credit -= 1
+                use_etag = etags.get(path)
+
+            started = time.perf_counter()
+            response = await request(reader, writer, target.netloc, path, use_etag)
+            latencies.append(time.perf_counter() - started)
+
+            statuses[response["status"]] = statuses.get(response["status"], 0) + 1
+            if "etag" in response["headers"]:
+                etags[path] = response["headers"]["etag"]
+    finally:
+        writer.close()
+
+
+async def run_load_test(
+    url: str = DEFAULT_URL,
+    paths: List[str] = None,
+    connections: int = 50,
+    requests: int = 5000,
+    revalidate: float = 0.5
+) -> Dict[str, Any]:
+    """
+    Run the load test and summarize the results.
+
+    Args:
+        url: Server base URL
+        paths: Paths to request round-robin (default: DEFAULT_PATHS)
+        connections: Concurrent keep-alive connections
+        requests: Total number of requests
+        revalidate: Fraction of requests sent with If-None-Match
+
+    Returns:
+        Dict with request count, elapsed seconds, requests/second,
+        latency percentiles (ms) and status code counts
+    """
+    paths = paths or DEFAULT_PATHS
+    latencies = []
+    statuses = {}
+
+    per_connection = [requests // connections + (1 if i < requests % connections else 0)
+                      for i in range(connections)]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        worker(url, paths, count, revalidate, latencies, statuses)
+        for count in per_connection if count
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+
+    return {
+        "requests": len(latencies),
+        "elapsed": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a load test against a running stats server."""
+    parser = argparse.ArgumentParser(description="Load-test the local stats server")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Server base URL")
+    parser.add_argument("--connections", type=int, default=50, help="Concurrent connections")
+    parser.add_argument("--requests", type=int, default=5000, help="Total requests")
+    parser.add_argument("--revalidate", type=float, default=0.5,
+                        help="Fraction of requests sent with If-None-Match (0-1)")
+    parser.add_argument("paths", nargs="*", help="Paths to request (default: a mix of endpoints)")
+    args = parser.parse_args(argv)
+
+    try:
+        result = asyncio.run(run_load_test(
+            args.url, args.paths, args.connections, args.requests, args.revalidate
+        ))
+    except OSError as e:
+        print(f"❌ Could not reach {args.url}: {e}", file=sys.stderr)
+        return 1
+
+    print(f"📈 {result['requests']} requests in {result['elapsed']:.2f}s "
+          f"({result['rps']:.0f} req/s, {args.connections} connections)")
+    print(f"   Latency: p50 {result['p50_ms']:.2f}ms, p95 {result['p95_ms']:.2f}ms, "
+          f"p99 {result['p99_ms']:.2f}ms")
+    print(f"   Status codes: {result['statuses']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
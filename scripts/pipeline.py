@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Run the data pipeline as a DAG of named stages.
+
+Each stage declares the stages it depends on and receives their outputs.
+Stages whose dependencies are done run concurrently in a thread pool, so
+independent API calls and analyzers overlap.
+
+A cacheable stage's output is saved under data/.pipeline_cache/, keyed by
+a hash of its inputs, its parameters and its code. On a rerun, a stage
+whose key is unchanged is served from the cache instead of executing.
+Stages with side effects or live data (fetches, writes) opt out with
+cache=False and always run.
+"""
+
+import json
+import time
+import hashlib
+import inspect
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Callable, Iterable
+from pathlib import Path
+
+# Configuration
+CACHE_DIR = Path("data") / ".pipeline_cache"
+MAX_WORKERS = 4        # Stages running at once
+TIMELINE_WIDTH = 40    # Characters in a timeline bar
+
+
+class Stage:
+    """A named pipeline step."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        deps: Iterable[str] = (),
+        cache: bool = True,
+        code: Iterable[Callable] = (),
+        params: Any = None
+    ):
+        """
+        Args:
+            name: Unique stage name
+            func: Called with a dict of dependency outputs, keyed by stage name
+            deps: Names of the stages this one needs
+            cache: Whether the output may be served from the cache
+            code: Helpers the stage calls; their source is part of the cache key
+            params: Configuration the output depends on (must be JSON-serializable)
+        """
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.cache = cache
+        self.code = list(code)
+        self.params = params
+
+    def code_version(self) -> str:
+        """Hash of the source of the stage function and its helpers."""
+        digest = hashlib.sha256()
+        for func in [self.func, *self.code]:
+            try:
+                source = inspect.getsource(func)
+            except (OSError, TypeError):
+                source = getattr(func, "__qualname__", repr(func))
+            digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+
+def hash_output(value: Any) -> str:
+    """Stable hash of a JSON-serializable value."""
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def order_stages(stages: List[Stage]) -> List[Stage]:
+    """
+    Check the stage graph and return the stages in dependency order.
+
+    Raises:
+        ValueError: On duplicate names, unknown dependencies or cycles
+    """
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate pipeline stage: {stage.name}")
+        by_name[stage.name] = stage
+
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+
+    ordered = []
+    done = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [stage for stage in remaining if all(dep in done for dep in stage.deps)]
+        if not ready:
+            names = ", ".join(stage.name for stage in remaining)
+            raise ValueError(f"Pipeline has a dependency cycle among: {names}")
+        for stage in ready:
+            ordered.append(stage)
+            done.add(stage.name)
+            remaining.remove(stage)
+    return ordered
+
+
+def run_stage(
+    stage: Stage,
+    inputs: Dict[str, Any],
+    input_hashes: Dict[str, str],
+    cache_dir: Path,
+    force: bool
+) -> Dict[str, Any]:
+    """Run one stage, or load its output from the cache if its key matches."""
+    started = time.perf_counter()
+    cache_file = cache_dir / f"{stage.name}.json"
+    key = None
+
+    if stage.cache:
+        key = hash_output({
+            "code": stage.code_version(),
+            "params": stage.params,
+            "inputs": input_hashes,
+        })
+        if not force:
+            try:
+                with open(cache_file, "r") as f:
+                    entry = json.load(f)
+                if entry.get("key") == key:
+                    return {"output": entry["output"], "status": "cached", "started": started}
+            except (OSError, ValueError):
+                pass
+
+    output = stage.func(inputs)
+
+    if key is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump({"key": key, "output": output}, f)
+
+    return {"output": output, "status": "ran", "started": started}
+
+
+def print_timeline(timeline: List[Dict[str, Any]], elapsed: float) -> None:
+    """Print when each stage started and finished, relative to the pipeline start."""
+    print(f"⏱️  Pipeline timeline ({elapsed:.2f}s)")
+    scale = TIMELINE_WIDTH / elapsed if elapsed else 0
+    name_width = max((len(entry["name"]) for entry in timeline), default=0)
+
+    for entry in timeline:
+        start = int(entry["start"] * scale)
+        length = max(int(entry["end"] * scale) - start, 1)
+        bar = (" " * start + "█" * length).ljust(TIMELINE_WIDTH)[:TIMELINE_WIDTH]
+        print(f"   {entry['name']:<{name_width}}  {entry['status']:<7} |{bar}| "
+              f"{entry['start']:.2f}s → {entry['end']:.2f}s")
+
+
+def run_pipeline(
+    stages: List[Stage],
+    cache_dir: Path = CACHE_DIR,
+    max_workers: int = MAX_WORKERS,
+    force: bool = False,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Run a pipeline, executing each stage as soon as its dependencies are done.
+
+    If a stage fails, no new stages are started; the ones already running
+    finish, the timeline is printed and the error is re-raised.
+
+    Args:
+        stages: Pipeline stages (any order)
+        cache_dir: Where cacheable stage outputs are stored
+        max_workers: Maximum stages running at once
+        force: Ignore cached outputs and run every stage
+        verbose: Print the per-stage timeline
+
+    Returns:
+        Dict with "outputs" (stage name -> output), the "timeline" entries
+        (name, status, start, end) in completion order, and "elapsed" seconds
+    """
+    ordered = order_stages(stages)
+    outputs = {}
+    hashes = {}
+    timeline = []
+    pending = list(ordered)
+    running = {}
+    error = None
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while pending or running:
+            if error is None:
+                for stage in [s for s in pending if all(dep in outputs for dep in s.deps)]:
+                    pending.remove(stage)
+                    future = pool.submit(
+                        run_stage, stage,
+                        {dep: outputs[dep] for dep in stage.deps},
+                        {dep: hashes[dep] for dep in stage.deps},
+                        cache_dir, force
+                    )
+                    running[future] = stage
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                finished = time.perf_counter() - started
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = error or e
+                    timeline.append({"name": stage.name, "status": "failed",
+                                     "start": finished, "end": finished})
+                    continue
+
+                outputs[stage.name] = result["output"]
+                hashes[stage.name] = hash_output(result["output"])
+                timeline.append({
+                    "name": stage.name,
+                    "status": result["status"],
+                    "start": result["started"] - started,
+                    "end": finished,
+                })
+
+    elapsed = time.perf_counter() - started
+    for stage in pending:
+        timeline.append({"name": stage.name, "status": "skipped", "start": elapsed, "end": elapsed})
+
+    if verbose:
+        print_timeline(timeline, elapsed)
+    if error is not None:
+        raise error
+
+    return {"outputs": outputs, "timeline": timeline, "elapsed": elapsed}
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for AI-generated README sections.
+
+github_stats.json is split into one input blob per README section and each
+blob is hashed. The cache maps an input hash to the section markdown that
+was last accepted for it, so a scheduled run only needs the AI to rewrite
+the sections whose inputs actually changed.
+
+Every hash is salted with the guidelines and the badge helpers (constants.py
+and the Simple Icons index), so changing how badges resolve invalidates
+everything. A section that swallowed an unknown "## " heading is cached on
+the full stats instead, since there is no telling what that heading shows.
+
+Usage:
+    python3 scripts/section_cache.py plan    # write data/section_manifest.json
+    python3 scripts/section_cache.py accept  # store README.md sections in the cache
+"""
+
+import sys
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from pathlib import Path
+
+try:
+    from constants import USER_SOCIAL_LINKS
+except ImportError:
+    # If running from different directory
+    sys.path.insert(0, str(Path(__file__).parent))
+    from constants import USER_SOCIAL_LINKS
+
+# Configuration
+DATA_DIR = Path("data")
+CACHE_FILE = DATA_DIR / "section_cache.json"
+MANIFEST_FILE = DATA_DIR / "section_manifest.json"
+GUIDELINES_FILE = Path(__file__).parent / "ai_guidelines.md"
+SALT_FILES = [
+    GUIDELINES_FILE,
+    Path(__file__).parent / "constants.py",
+    Path(__file__).parent / "simple_icons.json",
+]
+MAX_ENTRIES_PER_SECTION = 5  # Older accepted versions are pruned
+
+# README sections, in document order. "match" is a lowercase substring of
+# the "## " heading; the header is everything before the first heading.
+SECTIONS = [
+    {"name": "header", "match": None},
+    {"name": "working_on", "match": "working on"},
+    {"name": "activity", "match": "activity"},
+    {"name": "featured", "match": "featured"},
+    {"name": "tech_stack", "match": "tech stack"},
+    {"name": "github_stats", "match": "github stats"},
+    {"name": "highlights", "match": "highlights"},
+    {"name": "philosophy", "match": "philosophy"},
+    {"name": "connect", "match": "connect"},
+]
+
+# Keys of github_stats.json that never show up in the README
+IGNORED_KEYS = ("updated_at", "instructions")
+
+
+def section_inputs(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Split github_stats.json into the input blob each section depends on."""
+    user = stats.get("user", {})
+    languages = stats.get("languages", {})
+    top_languages = languages.get("top_8", [])
+    return {
+        # Name, tagline and the repository count badge
+        "header": {
+            "username": user.get("username"),
+            "name": user.get("name"),
+            "bio": user.get("bio"),
+            "public_repos": user.get("public_repos"),
+        },
+        # Projects, repository count and the main languages
+        "working_on": {
+            "tracked_projects": stats.get("tracked_projects") or {"coder/registry": stats.get("coder_stats")},
+            "public_repos": user.get("public_repos"),
+            "top_languages": top_languages,
+        },
+        "activity": {"recent_activity": stats.get("recent_activity", [])},
+        # Ranked repos; the score itself decays daily and isn't shown
+        "featured": {
+            "featured_repos": [
+                {key: value for key, value in repo.items() if key != "score"}
+                for repo in stats.get("featured_repos", [])
+            ],
+        },
+        "tech_stack": {"languages": languages},
+        # Stats cards, whose alt text names the repo count and top languages
+        "github_stats": {
+            "username": user.get("username"),
+            "public_repos": user.get("public_repos"),
+            "top_languages": top_languages,
+        },
+        # Repository and language count badges plus the language list
+        "highlights": {
+            "public_repos": user.get("public_repos"),
+            "total_languages": languages.get("total_count"),
+            "languages": languages.get("all_detected", []),
+            "top_languages": top_languages,
+        },
+        "philosophy": {"bio": user.get("bio")},
+        "connect": {"social_links": [list(link) for link in USER_SOCIAL_LINKS]},
+    }
+
+
+def full_input(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Everything in github_stats.json that can end up in the README."""
+    return {key: value for key, value in stats.items() if key not in IGNORED_KEYS}
+
+
+def hash_input(section: str, blob: Any, salt: str = "") -> str:
+    """Hash a section's input blob (canonical JSON) together with its name."""
+    canonical = json.dumps(blob, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{section}\0{salt}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+def render_salt(files: Optional[List[Path]] = None) -> str:
+    """Hash of the guidelines and badge helpers, so editing them invalidates every section."""
+    digest = hashlib.sha256()
+    for path in SALT_FILES if files is None else files:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def load_json(path: Path, default: Any) -> Any:
+    """Load a JSON file, falling back to a default if missing or corrupt."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path: Path, data: Any) -> None:
+    """Save data as indented JSON."""
+    path.parent.mkdir(exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def build_manifest(stats: Dict[str, Any], cache: Dict[str, Dict[str, Any]], salt: str = "") -> Dict[str, Any]:
+    """
+    Work out which sections are cache hits and which need regeneration.
+
+    Each entry has two hashes: "hash" over the section's own inputs, and
+    "full_hash" over the full stats, used for sections that swallowed an
+    unknown heading (see accept).
+
+    Returns:
+        Manifest with one entry per section. Hits carry their cached markdown
+        so the AI step can reuse it verbatim.
+    """
+    inputs = section_inputs(stats)
+    everything = full_input(stats)
+    sections = []
+
+    for section in SECTIONS:
+        name = section["name"]
+        digest = hash_input(name, inputs[name], salt)
+        full_digest = hash_input(name, {"section": inputs[name], "stats": everything}, salt)
+        entry = {"name": name, "hash": digest, "full_hash": full_digest}
+        cached = cache.get(digest) or cache.get(full_digest)
+        if cached:
+            entry["status"] = "hit"
+            entry["markdown"] = cached["markdown"]
+        else:
+            entry["status"] = "regenerate"
+        sections.append(entry)
+
+    return {
+        "generated_at": datetime.utcnow().isoformat(),
+        "regenerate": [s["name"] for s in sections if s["status"] == "regenerate"],
+        "sections": sections,
+    }
+
+
+def split_readme(content: str) -> Dict[str, str]:
+    """
+    Split README content into known sections at "## " headings.
+
+    Headings that don't match a known section stay attached to the section
+    before them, so nothing is lost when the README is reassembled.
+    """
+    parts = {"header": []}
+    current = "header"
+    in_fence = False
+
+    for line in content.splitlines():
+        if line.startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            heading = line.lower()
+            for section in SECTIONS:
+                if section["match"] and section["match"] in heading and section["name"] not in parts:
+                    current = section["name"]
+                    parts[current] = []
+                    break
+        parts[current].append(line)
+
+    return {name: "\n".join(lines).strip() + "\n" for name, lines in parts.items()}
+
+
+def has_unknown_heading(markdown: str) -> bool:
+    """Whether a split section contains a "## " heading other than its own."""
+    headings = 0
+    in_fence = False
+    for line in markdown.splitlines():
+        if line.startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            headings += 1
+    own = 1 if markdown.startswith("## ") else 0
+    return headings > own
+
+
+def plan(
+    stats: Dict[str, Any],
+    cache_file: Path = CACHE_FILE,
+    manifest_file: Path = MANIFEST_FILE
+) -> Dict[str, Any]:
+    """Write the section manifest for the current stats."""
+    manifest = build_manifest(stats, load_json(cache_file, {}), render_salt())
+    save_json(manifest_file, manifest)
+
+    hits = len(manifest["sections"]) - len(manifest["regenerate"])
+    print(f"✅ Section manifest saved to {manifest_file}")
+    print(f"   - {hits} cached, {len(manifest['regenerate'])} to regenerate: "
+          f"{', '.join(manifest['regenerate']) or 'none'}")
+    return manifest
+
+
+def accept(
+    readme: str,
+    manifest: Dict[str, Any],
+    cache: Dict[str, Dict[str, Any]]
+) -> List[str]:
+    """
+    Store the README's sections in the cache under the manifest's hashes.
+
+    A section with an unknown heading folded into it is stored under its
+    full_hash, so any change to the stats regenerates it.
+
+    Returns:
+        Names of the sections that were stored
+    """
+    parts = split_readme(readme)
+    now = datetime.utcnow().isoformat()
+    stored = []
+
+    for section in manifest.get("sections", []):
+        markdown = parts.get(section["name"])
+        if markdown is None:
+            continue
+        digest = section["hash"]
+        if has_unknown_heading(markdown):
+            digest = section.get("full_hash", digest)
+        cache[digest] = {"section": section["name"], "markdown": markdown, "accepted_at": now}
+        stored.append(section["name"])
+
+    prune(cache)
+    return stored
+
+
+def prune(cache: Dict[str, Dict[str, Any]], keep: int = MAX_ENTRIES_PER_SECTION) -> None:
+    """Keep only the newest few accepted versions of each section."""
+    by_section = {}
+    for digest, entry in cache.items():
+        by_section.setdefault(entry.get("section"), []).append((entry.get("accepted_at", ""), digest))
+
+    for entries in by_section.values():
+        entries.sort(reverse=True)
+        for _, digest in entries[keep:]:
+            del cache[digest]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Plan or accept README sections."""
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "plan"
+
+    if command == "plan":
+        plan(load_json(DATA_DIR / "github_stats.json", {}))
+        return 0
+
+    if command == "accept":
+        manifest = load_json(MANIFEST_FILE, None)
+        if not manifest:
+            print(f"❌ No manifest at {MANIFEST_FILE} - run generate_readme.py first", file=sys.stderr)
+            return 1
+        with open("README.md", "r", encoding="utf-8") as f:
+            readme = f.read()
+        cache = load_json(CACHE_FILE, {})
+        stored = accept(readme, manifest, cache)
+        save_json(CACHE_FILE, cache)
+        print(f"✅ Cached {len(stored)} README sections: {', '.join(stored)}")
+        return 0
+
+    print(f"❌ Unknown command: {command} (use 'plan' or 'accept')", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Serve profile stats, badges and cards from memory.
+
+Loads data/github_stats.json and data/github_data.json once, pre-renders
+every response body with its ETag, and serves them from an asyncio server
+so a single core can handle many concurrent clients. The data files are
+watched and reloaded when they change.
+
+Endpoints:
+    /health                  liveness check
+    /stats                   full github_stats.json
+    /stats/<key>             one top-level key (languages, recent_activity, ...)
+    /raw/<key>               one key of github_data.json (user, repos, events)
+    /badge/<slug>.svg        badge for a detected language (C# -> csharp)
+    /card/languages.svg      card with languages by repo count
+
+Usage:
+    python3 scripts/stats_server.py [--host 127.0.0.1] [--port 8080]
+"""
+
+import sys
+import json
+import asyncio
+import hashlib
+import argparse
+from html import escape
+from urllib.parse import unquote, urlparse
+from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+
+try:
+    from constants import CODER_BLUE, CODER_DARK, resolve_icon, title_to_slug
+except ImportError:
+    # If running from different directory
+    sys.path.insert(0, str(Path(__file__).parent))
+    from constants import CODER_BLUE, CODER_DARK, resolve_icon, title_to_slug
+
+# Configuration
+DATA_DIR = Path("data")
+STATS_FILE = DATA_DIR / "github_stats.json"
+RAW_FILE = DATA_DIR / "github_data.json"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+CACHE_MAX_AGE = 300        # Seconds clients/CDNs may reuse a response
+RELOAD_INTERVAL = 2.0      # Seconds between data file checks
+MAX_HEADER_BYTES = 16384   # Reject requests with larger headers
+MAX_BODY_BYTES = 65536     # Larger request bodies close the connection instead of being drained
+IDLE_TIMEOUT = 15.0        # Seconds an idle keep-alive connection stays open
+
+STATUS_TEXT = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+Response = Tuple[bytes, str, str]  # (body, content type, ETag)
+
+
+def make_response(body: bytes, content_type: str) -> Response:
+    """Pair a body with its content type and a strong ETag."""
+    return body, content_type, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def json_response(data: Any) -> Response:
+    """Serialize data as compact JSON."""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return make_response(body, "application/json; charset=utf-8")
+
+
+def tech_color(name: str) -> str:
+    """Brand colour for a technology, or Coder blue if it has no icon."""
+    icon = resolve_icon(name)
+    return icon[1] if icon else CODER_BLUE
+
+
+def text_width(text: str) -> int:
+    """Approximate rendered width of badge text in pixels."""
+    return 7 * len(text) + 10
+
+
+def render_badge(label: str, color: str) -> bytes:
+    """Render a flat single-segment SVG badge."""
+    width = text_width(label)
+    label = escape(label)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="20" role="img" '
+        f'aria-label="{label}"><title>{label}</title>'
+        f'<rect width="{width}" height="20" rx="3" fill="#{color}"/>'
+        f'<text x="{width // 2}" y="14" fill="#fff" text-anchor="middle" '
+        f'font-family="Verdana,Geneva,sans-serif" font-size="11">{label}</text></svg>'
+    ).encode("utf-8")
+
+
+def render_language_card(by_count: Dict[str, int]) -> bytes:
+    """Render an SVG card listing languages by repo count as bars."""
+    rows = list(by_count.items())[:8]
+    top = max(by_count.values(), default=1)
+    height = 40 + 24 * len(rows)
+    bars = []
+
+    for i, (language, count) in enumerate(rows):
+        y = 40 + 24 * i
+        bar = max(int(180 * count / top), 4)
+        bars.append(
+            f'<text x="20" y="{y + 12}" fill="#c9d1d9" font-size="12">{escape(language)}</text>'
+            f'<rect x="120" y="{y + 2}" width="{bar}" height="12" rx="2" fill="#{tech_color(language)}"/>'
+            f'<text x="{128 + bar}" y="{y + 12}" fill="#8b949e" font-size="11">{count}</text>'
+        )
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="360" height="{height}" role="img" '
+        f'aria-label="Languages by repository count" font-family="Segoe UI,Ubuntu,sans-serif">'
+        f'<rect width="360" height="{height}" rx="6" fill="#{CODER_DARK}"/>'
+        f'<text x="20" y="26" fill="#{CODER_BLUE}" font-size="15" font-weight="600">Languages</text>'
+        f'{"".join(bars)}</svg>'
+    ).encode("utf-8")
+
+
+def badge_slug(language: str) -> str:
+    """URL-safe badge name for a language (C# -> csharp, C++ -> cplusplus)."""
+    return title_to_slug(language.replace("#", "sharp"))
+
+
+def build_routes(stats: Dict[str, Any], raw: Dict[str, Any]) -> Dict[str, Response]:
+    """Pre-render every response body, keyed by request path."""
+    routes = {
+        "/health": json_response({"status": "ok", "updated_at": stats.get("updated_at")}),
+        "/stats": json_response(stats),
+    }
+
+    for key, value in stats.items():
+        routes[f"/stats/{key}"] = json_response(value)
+    for key, value in raw.items():
+        routes[f"/raw/{key}"] = json_response(value)
+
+    languages = stats.get("languages", {})
+    for language in languages.get("all_detected", []):
+        routes.setdefault(f"/badge/{badge_slug(language)}.svg", make_response(
+            render_badge(language, tech_color(language)), "image/svg+xml"
+        ))
+    routes["/card/languages.svg"] = make_response(
+        render_language_card(languages.get("by_repo_count", {})), "image/svg+xml"
+    )
+
+    return routes
+
+
+def load_json(path: Path) -> Dict[str, Any]:
+    """Load a JSON data file, treating a missing file as empty."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class StatsServer:
+    """In-memory stats server with ETag handling and hot reload."""
+
+    def __init__(self, stats_file: Path = STATS_FILE, raw_file: Path = RAW_FILE):
+        self.stats_file = stats_file
+        self.raw_file = raw_file
+        self.routes: Dict[str, Response] = {}
+        self.mtimes: Optional[Tuple[int, int]] = None
+        self.reloads = 0
+
+    def file_mtimes(self) -> Tuple[int, int]:
+        """Modification times of both data files (0 if missing)."""
+        def mtime(path: Path) -> int:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return 0
+        return mtime(self.stats_file), mtime(self.raw_file)
+
+    def reload_if_changed(self) -> bool:
+        """Rebuild all responses if either data file changed since the last load."""
+        mtimes = self.file_mtimes()
+        if mtimes == self.mtimes:
+            return False
+
+        try:
+            routes = build_routes(load_json(self.stats_file), load_json(self.raw_file))
+        except ValueError as e:
+            # Half-written file - keep serving the old data and retry next tick
+            print(f"⚠️  Reload skipped, data file not valid JSON: {e}", file=sys.stderr)
+            return False
+
+        # Swap in one assignment so requests never see a partial table
+        self.routes = routes
+        self.mtimes = mtimes
+        self.reloads += 1
+        print(f"🔄 Loaded stats ({len(routes)} routes)")
+        return True
+
+    async def watch(self, interval: float = RELOAD_INTERVAL) -> None:
+        """Poll the data files and hot-reload on change."""
+        while True:
+            await asyncio.sleep(interval)
+            self.reload_if_changed()
+
+    def respond(self, method: str, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Resolve a request to (status, headers, body)."""
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b""
+
+        route = self.routes.get(unquote(urlparse(path).path).rstrip("/").lower() or "/")
+        if route is None:
+            return 404, {"Content-Type": "application/json"}, b'{"error":"not found"}'
+
+        body, content_type, etag = route
+        response_headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={CACHE_MAX_AGE}",
+        }
+
+        if_none_match = headers.get("if-none-match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return 304, response_headers, b""
+
+        response_headers["Content-Type"] = content_type
+        return 200, response_headers, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection, with keep-alive."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break  # Client closed the connection or went idle
+                except asyncio.LimitOverrunError:
+                    writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, path, version = lines[0].split(" ", 2)
+                except ValueError:
+                    writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                    break
+
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                # Nothing here takes a request body, but it must still be consumed
+                # or its bytes would be parsed as the next request on the connection
+                try:
+                    body_length = int(headers.get("content-length", "0"))
+                except ValueError:
+                    body_length = -1
+                if body_length < 0:
+                    writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                    break
+                framed = "transfer-encoding" not in headers and body_length <= MAX_BODY_BYTES
+                if framed and body_length:
+                    try:
+                        await asyncio.wait_for(reader.readexactly(body_length), IDLE_TIMEOUT)
+                    except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                        break
+
+                status, response_headers, body = self.respond(method, path, headers)
+                keep_alive = (
+                    framed
+                    and method in ("GET", "HEAD")
+                    and headers.get("connection", "").lower() != "close"
+                    and (version == "HTTP/1.1" or headers.get("connection", "").lower() == "keep-alive")
+                )
+
+                response_headers["Content-Length"] = str(len(body))
+                response_headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+                head_lines = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}"]
+                head_lines += [f"{name}: {value}" for name, value in response_headers.items()]
+                writer.write(
+                    ("\r\n".join(head_lines) + "\r\n\r\n").encode("latin-1")
+                    + (b"" if method == "HEAD" else body)
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Load the data and start listening (returns the running server)."""
+        self.reload_if_changed()
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Run the server and the file watcher until cancelled."""
+        server = await self.start(host, port)
+        watcher = asyncio.create_task(self.watch())
+        address = server.sockets[0].getsockname()
+        print(f"📡 Serving stats on http://{address[0]}:{address[1]}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the stats server."""
+    parser = argparse.ArgumentParser(description="Serve stats, badges and cards from memory")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(StatsServer().serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
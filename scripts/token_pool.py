@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Spread GitHub API requests over several tokens.
+
+One token gets 5,000 core requests (and 30 search requests) per hour, so
+the pool accepts several and tracks each one's quota from the
+X-RateLimit-* response headers. Every request goes to the token with the
+most remaining quota for that API resource. Exhausted tokens are skipped
+until their reset time. Until a token's first response arrives, its quota
+is estimated from the hourly limit minus the requests already sent with it.
+
+Tokens are read from GITHUB_TOKENS (comma or whitespace separated) plus
+GITHUB_TOKEN. With no tokens, requests are sent unauthenticated.
+"""
+
+import os
+import re
+import time
+import threading
+from typing import Dict, List, Any, Optional, Mapping
+
+
+class TokenPoolExhausted(RuntimeError):
+    """Every token is out of quota for a resource."""
+
+    def __init__(self, resource: str, reset_at: float):
+        self.resource = resource
+        self.reset_at = reset_at
+        wait = max(reset_at - time.time(), 0)
+        super().__init__(f"All GitHub tokens are rate limited for '{resource}' "
+                         f"(next reset in {wait:.0f}s)")
+
+
+def resource_for_path(path: str) -> str:
+    """GitHub rate-limit bucket for an API path."""
+    return "search" if path.startswith("/search/") else "core"
+
+
+def mask_token(token: str) -> str:
+    """Printable token identifier that doesn't leak the secret."""
+    return f"…{token[-4:]}" if len(token) > 4 else "…"
+
+
+class TokenPool:
+    """Thread-safe set of tokens with per-resource quota tracking."""
+
+    def __init__(self, tokens: List[str]):
+        # dict.fromkeys de-duplicates while keeping order
+        self.tokens = list(dict.fromkeys(token for token in tokens if token))
+        self.quota: Dict[str, Dict[str, Dict[str, float]]] = {token: {} for token in self.tokens}
+        # Requests reserved on each token while its quota was unknown
+        self.unmetered: Dict[str, Dict[str, int]] = {token: {} for token in self.tokens}
+        self.limits: Dict[str, int] = {}  # Hourly limit per resource (X-RateLimit-Limit)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "TokenPool":
+        """Build a pool from GITHUB_TOKENS and GITHUB_TOKEN."""
+        env = os.environ if env is None else env
+        tokens = re.split(r"[\s,]+", env.get("GITHUB_TOKENS", "").strip())
+        tokens.append(env.get("GITHUB_TOKEN", ""))
+        return cls(tokens)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def acquire(self, resource: str = "core") -> Optional[str]:
+        """
+        Pick the token with the most remaining quota and reserve one request.
+
+        Tokens with unknown quota (not used yet, or past their reset time)
+        count as having the full hourly limit (unlimited until a response
+        has reported it) less the requests already sent with them. Ties go
+        to the token with the fewest such requests, so a burst of
+        concurrent requests at startup is spread over all tokens.
+
+        Returns:
+            A token, or None if the pool is empty (unauthenticated requests)
+
+        Raises:
+            TokenPoolExhausted: If every token is out of quota for the resource
+        """
+        if not self.tokens:
+            return None
+
+        now = time.time()
+        with self.lock:
+            best = None
+            best_rank = None
+            next_reset = float("inf")
+            limit = self.limits.get(resource, float("inf"))
+
+            for token in self.tokens:
+                state = self.quota[token].get(resource)
+                sent = 0
+                if state is None or state["reset"] <= now:
+                    sent = self.unmetered[token].get(resource, 0)
+                    remaining = limit - sent
+                else:
+                    remaining = state["remaining"]
+                if remaining <= 0:
+                    # Only a token whose known quota ran out has a reset time
+                    next_reset = min(next_reset, state["reset"] if state else now)
+                elif best_rank is None or (remaining, -sent) > best_rank:
+                    best, best_rank = token, (remaining, -sent)
+
+            if best is None:
+                raise TokenPoolExhausted(resource, next_reset)
+
+            # Reserve the request so concurrent callers spread across tokens
+            state = self.quota[best].get(resource)
+            if state is not None and state["reset"] > now:
+                state["remaining"] -= 1
+            else:
+                self.unmetered[best][resource] = self.unmetered[best].get(resource, 0) + 1
+            return best
+
+    def update(self, token: Optional[str], headers: Mapping[str, str], status: int = 200) -> None:
+        """
+        Record a token's quota from a response.
+
+        Responses can arrive out of order, so within one rate-limit window
+        the lowest remaining count wins. Once the hourly limit is known, the
+        first response for a token also counts requests sent with it that
+        may still be in flight. A 403/429
+        with Retry-After (GitHub's secondary rate limit) benches the token
+        for that long.
+        """
+        if token is None or token not in self.quota:
+            return
+
+        headers = {name.lower(): value for name, value in headers.items()}
+        resource = headers.get("x-ratelimit-resource", "core")
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            remaining = reset = None
+
+        try:
+            limit = int(headers["x-ratelimit-limit"])
+        except (KeyError, ValueError):
+            limit = None
+
+        if status in (403, 429) and "retry-after" in headers:
+            try:
+                remaining, reset = 0, time.time() + float(headers["retry-after"])
+            except ValueError:
+                pass
+
+        if remaining is None:
+            return
+
+        with self.lock:
+            if limit is not None:
+                self.limits[resource] = limit
+            state = self.quota[token].get(resource)
+            if state is not None and state["reset"] == reset:
+                remaining = min(remaining, state["remaining"])
+            elif state is None or state["reset"] <= time.time():
+                # Requests sent while the quota was unknown may not be counted yet
+                sent = self.unmetered[token].pop(resource, 0)
+                if resource in self.limits:
+                    remaining = min(remaining, self.limits[resource] - sent)
+            self.quota[token][resource] = {"remaining": remaining, "reset": reset}
+
+    def is_exhausted(self, token: Optional[str], resource: str = "core") -> bool:
+        """Whether a token is known to be out of quota right now."""
+        with self.lock:
+            state = self.quota.get(token, {}).get(resource)
+            return bool(state) and state["remaining"] <= 0 and state["reset"] > time.time()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Known quota per token (masked) and resource, for reporting."""
+        with self.lock:
+            return [
+                {"token": mask_token(token), "resource": resource, **state}
+                for token in self.tokens
+                for resource, state in sorted(self.quota[token].items())
+            ]
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Validate every link and image in the generated README.
+
+The constants.py helpers only build URLs for trusted services, but those
+services can still go down (the herokuapp streak card has shipped broken
+images before). This script extracts all links and images in one pass,
+checks image hosts against TRUSTED_SERVICES and probes the URLs concurrently.
+
+Probe results are kept in a small TTL cache so repeat runs are near-instant.
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    from constants import TRUSTED_SERVICES
+except ImportError:
+    # If running from different directory
+    sys.path.insert(0, str(Path(__file__).parent))
+    from constants import TRUSTED_SERVICES
+
+# Configuration
+CACHE_FILE = Path("data") / "link_cache.json"
+CACHE_TTL_SECONDS = 6 * 60 * 60  # Re-probe a working URL at most every 6 hours
+MAX_WORKERS = 8                  # Bounded parallelism for probes
+PROBE_TIMEOUT = 10               # Seconds per request
+
+# One alternation so the README is scanned exactly once:
+#   1. Markdown image: ![alt](url)
+#   2. Markdown link: [text](url), where the text may itself be an image
+#      (the usual badge link [![alt](img)](href))
+#   3. HTML image: <img ... src="url">
+#   4. HTML link: <a ... href="url">
+MD_IMAGE = r'!\[[^\]]*\]\(\s*(?P<{name}>[^)\s]+)[^)]*\)'
+LINK_PATTERN = re.compile(
+    MD_IMAGE.format(name="md_img")
+    + r'|\[(?P<md_text>(?:[^\[\]]|!\[[^\]]*\]\([^)]*\))*)\]\(\s*(?P<md_url>[^)\s]+)[^)]*\)'
+    r'|<img\b[^>]*?\bsrc\s*=\s*["\'](?P<img_url>[^"\']+)["\']'
+    r'|<a\b[^>]*?\bhref\s*=\s*["\'](?P<a_url>[^"\']+)["\']',
+    re.IGNORECASE
+)
+NESTED_IMAGE_PATTERN = re.compile(MD_IMAGE.format(name="url"))
+
+
+def extract_urls(content: str) -> Dict[str, List[str]]:
+    """
+    Extract all images and links from README content in a single pass.
+
+    Args:
+        content: README markdown/HTML content
+
+    Returns:
+        Dict with de-duplicated "images" and "links" lists, in document order
+    """
+    images = {}
+    links = {}
+
+    # dicts keep insertion order, so setdefault de-duplicates without reordering
+    for match in LINK_PATTERN.finditer(content):
+        if match.group("md_img"):
+            images.setdefault(match.group("md_img"), None)
+        elif match.group("md_url"):
+            # A badge link consumes its image, so pick it out of the link text
+            for image in NESTED_IMAGE_PATTERN.finditer(match.group("md_text")):
+                images.setdefault(image.group("url"), None)
+            links.setdefault(match.group("md_url"), None)
+        elif match.group("img_url"):
+            images.setdefault(match.group("img_url"), None)
+        else:
+            links.setdefault(match.group("a_url"), None)
+
+    return {"images": list(images), "links": list(links)}
+
+
+def is_trusted_host(url: str, trusted: Optional[List[str]] = None) -> bool:
+    """Check whether a URL's host is (a subdomain of) a trusted service."""
+    trusted = TRUSTED_SERVICES if trusted is None else trusted
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == service or host.endswith("." + service) for service in trusted)
+
+
+def load_cache(cache_file: Path = CACHE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Load the probe cache, returning an empty cache if missing or corrupt."""
+    try:
+        with open(cache_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, Dict[str, Any]], cache_file: Path = CACHE_FILE) -> None:
+    """Persist the probe cache."""
+    cache_file.parent.mkdir(exist_ok=True)
+    with open(cache_file, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def probe_url(url: str, timeout: float = PROBE_TIMEOUT) -> Dict[str, Any]:
+    """
+    Probe a single URL.
+
+    Uses a streamed GET rather than HEAD because several badge/card services
+    don't implement HEAD. Only the headers are read.
+
+    Returns:
+        Dict with "ok", "status" and (on failure) "error"
+    """
+    try:
+        with requests.get(url, timeout=timeout, stream=True, allow_redirects=True) as response:
+            return {"ok": response.status_code < 400, "status": response.status_code}
+    except requests.RequestException as e:
+        return {"ok": False, "status": 0, "error": str(e)}
+
+
+def probe_urls(
+    urls: List[str],
+    cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    ttl: float = CACHE_TTL_SECONDS,
+    max_workers: int = MAX_WORKERS,
+    timeout: float = PROBE_TIMEOUT,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Probe URLs concurrently, serving fresh results from the cache.
+
+    Only successful probes are cached, so a broken URL is re-checked on the
+    next run instead of being remembered as broken for a whole TTL.
+
+    Args:
+        urls: URLs to probe
+        cache: Probe cache (updated in place); None disables caching
+        ttl: Seconds a cached success stays valid
+        max_workers: Maximum concurrent probes
+        timeout: Seconds per request
+
+    Returns:
+        Dict mapping each URL to its probe result ("cached" marks cache hits)
+    """
+    now = time.time()
+    results = {}
+    pending = []
+
+    for url in urls:
+        entry = cache.get(url) if cache is not None else None
+        if entry and entry.get("ok") and now - entry.get("checked_at", 0) < ttl:
+            results[url] = dict(entry, cached=True)
+        else:
+            pending.append(url)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+            probed = pool.map(lambda url: probe_url(url, timeout), pending)
+            for url, result in zip(pending, probed):
+                result["checked_at"] = now
+                results[url] = dict(result, cached=False)
+                if cache is not None:
+                    if result["ok"]:
+                        cache[url] = result
+                    else:
+                        cache.pop(url, None)
+
+    return results
+
+
+def validate_readme(
+    content: str,
+    cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    check_links: bool = True,
+    **probe_options: Any,
+) -> Dict[str, Any]:
+    """
+    Validate all images and links in README content.
+
+    Images must come from a trusted service and load successfully - a
+    failure there is an error. Broken links are only warnings, since
+    social sites often reject automated requests.
+
+    Args:
+        content: README markdown/HTML content
+        cache: Probe cache (updated in place); None disables caching
+        check_links: Also probe regular links, not just images
+        **probe_options: Passed through to probe_urls (ttl, max_workers, timeout)
+
+    Returns:
+        Dict with "errors", "warnings", the extracted URLs and probe "results"
+    """
+    urls = extract_urls(content)
+    errors = []
+    warnings = []
+
+    for url in urls["images"]:
+        if not url.startswith(("http://", "https://")):
+            errors.append(f"Image is not an absolute URL: {url}")
+        elif not is_trusted_host(url):
+            errors.append(f"Image host is not a trusted service: {url}")
+
+    to_probe = [url for url in urls["images"] if url.startswith(("http://", "https://"))]
+    if check_links:
+        # mailto:, relative paths and #anchors can't be probed
+        to_probe += [
+            url for url in urls["links"]
+            if url.startswith(("http://", "https://")) and url not in to_probe
+        ]
+
+    results = probe_urls(to_probe, cache=cache, **probe_options)
+    image_set = set(urls["images"])
+
+    for url, result in results.items():
+        if result["ok"]:
+            continue
+        reason = result.get("error") or f"HTTP {result['status']}"
+        if url in image_set:
+            errors.append(f"Broken image ({reason}): {url}")
+        else:
+            warnings.append(f"Broken link ({reason}): {url}")
+
+    return {
+        "images": urls["images"],
+        "links": urls["links"],
+        "results": results,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Validate README.md and report broken or untrusted URLs."""
+    parser = argparse.ArgumentParser(description="Validate README links and images")
+    parser.add_argument("readme", nargs="?", default="README.md", help="README file to check")
+    parser.add_argument("--no-links", action="store_true", help="Only probe images")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the cache")
+    parser.add_argument("--ttl", type=float, default=CACHE_TTL_SECONDS, help="Cache TTL in seconds")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Maximum concurrent probes")
+    args = parser.parse_args(argv)
+
+    with open(args.readme, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    cache = None if args.no_cache else load_cache()
+    started = time.time()
+    report = validate_readme(
+        content,
+        cache=cache,
+        check_links=not args.no_links,
+        ttl=args.ttl,
+        max_workers=args.workers,
+    )
+    elapsed = time.time() - started
+
+    if cache is not None:
+        save_cache(cache)
+
+    cached = sum(1 for result in report["results"].values() if result["cached"])
+    print(f"🔍 Checked {len(report['images'])} images and {len(report['links'])} links "
+          f"in {elapsed:.2f}s ({cached} from cache)")
+
+    for warning in report["warnings"]:
+        print(f"  ⚠️  {warning}")
+    for error in report["errors"]:
+        print(f"  ❌ {error}")
+
+    if report["errors"]:
+        print(f"❌ {len(report['errors'])} problem(s) found")
+        return 1
+
+    print("✅ All images load from trusted services")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
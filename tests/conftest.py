@@ -0,0 +1,79 @@
+"""
+Shared fixtures and the per-test time budget.
+
+Every test gets DEFAULT_BUDGET seconds unless it's marked with
+``@pytest.mark.budget(seconds)``; a test that passes but runs over its
+budget is reported as a failure so slow tests can't creep into the gate.
+"""
+
+import sys
+import json
+import copy
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# The scripts are run as standalone files, not installed as a package
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from tests.stub_api import StubAPI  # noqa: E402
+
+DEFAULT_BUDGET = 2.0  # Seconds
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "budget(seconds): time budget for a single test")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if call.when != "call" or not report.passed:
+        return
+
+    marker = item.get_closest_marker("budget")
+    budget = marker.args[0] if marker else DEFAULT_BUDGET
+    if call.duration > budget:
+        report.outcome = "failed"
+        report.longrepr = f"Test took {call.duration:.2f}s, over its {budget:.2f}s budget"
+
+
+@pytest.fixture(scope="session")
+def _github_data():
+    with open(FIXTURES / "github_data.json", "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def github_data(_github_data):
+    """Fixture copy of data/github_data.json (user, repos, events)."""
+    return copy.deepcopy(_github_data)
+
+
+@pytest.fixture
+def stub_api(github_data, monkeypatch):
+    """Local GitHub API stub serving the fixture data; generate_readme points at it."""
+    import generate_readme
+
+    username = github_data["user"]["login"]
+    api = StubAPI({
+        f"/users/{username}": github_data["user"],
+        f"/users/{username}/repos": github_data["repos"],
+        f"/users/{username}/events/public": github_data["events"],
+    }).start()
+    monkeypatch.setattr(generate_readme, "GITHUB_API", api.url)
+    yield api
+    api.stop()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Temporary data directory for anything generate_readme writes."""
+    import generate_readme
+
+    monkeypatch.setattr(generate_readme, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(generate_readme, "REGISTRY_INDEX_FILE", tmp_path / "registry_index.json")
+    return tmp_path
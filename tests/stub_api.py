@@ -0,0 +1,67 @@
+"""
+Local stub of the GitHub REST API for tests.
+
+Routes map a request path to either a JSON-serializable payload or a
+handler ``(query, headers) -> (status, headers, payload)`` for endpoints
+that need to look at the request (search pagination, rate limits, ...).
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from typing import Dict, List, Any, Callable, Union
+
+Handler = Callable[[Dict[str, List[str]], Dict[str, str]], tuple]
+
+
+class StubAPI:
+    """Threaded HTTP server serving canned JSON responses."""
+
+    def __init__(self, routes: Dict[str, Union[Any, Handler]] = None):
+        self.routes = dict(routes or {})
+        self.requests: List[Dict[str, Any]] = []
+        stub = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                stub.requests.append({"path": url.path, "query": query, "headers": headers})
+
+                route = stub.routes.get(url.path)
+                if route is None:
+                    status, extra_headers, payload = 404, {}, {"message": "Not Found"}
+                elif callable(route):
+                    status, extra_headers, payload = route(query, headers)
+                else:
+                    status, extra_headers, payload = 200, {}, route
+
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in extra_headers.items():
+                    self.send_header(name, str(value))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def start(self) -> "StubAPI":
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def paths(self) -> List[str]:
+        """Paths requested so far, in order."""
+        return [request["path"] for request in self.requests]
@@ -0,0 +1,73 @@
+"""Tests for the token-budgeted AI digest."""
+
+import pytest
+
+from ai_digest import build_digest, GUIDELINES_FILE
+
+
+@pytest.fixture
+def stats():
+    return {
+        "user": {"username": "DevelopmentCats", "name": "DevCats"},
+        "coder_stats": {"total_prs": 0, "total_commits": 0, "total_issues": 0},
+        "tracked_projects": {},
+        "languages": {
+            "by_repo_count": {"Python": 3, "HCL": 1},
+            "all_detected": ["HCL", "Python"],
+            "top_8": ["Python", "HCL"],
+        },
+        "recent_activity": [],
+    }
+
+
+@pytest.fixture(scope="module")
+def guidelines():
+    return GUIDELINES_FILE.read_text(encoding="utf-8")
+
+
+def test_digest_within_budget(stats, guidelines):
+    digest = build_digest(stats, guidelines, budget=6000)
+
+    assert digest["chars"] <= 6000
+    assert digest["tokens"] == digest["chars"] // 4
+    assert digest["chars"] < len(guidelines)
+
+
+def test_digest_badges_for_every_language(stats, guidelines):
+    digest = build_digest(stats, guidelines)
+
+    assert "![HCL](https://img.shields.io/badge/HCL-" in digest["text"]
+    assert "logo=terraform" in digest["text"]
+    assert "![Python](https://img.shields.io/badge/Python-3776AB" in digest["text"]
+
+
+def test_digest_only_relevant_guidelines(stats, guidelines):
+    without_activity = build_digest(stats, guidelines, budget=100000)
+    stats["recent_activity"] = [{"icon": "📝", "description": "Pushed", "date": "2025-01-01"}]
+    with_activity = build_digest(stats, guidelines, budget=100000)
+
+    assert "when to show sections" not in without_activity["included"]
+    assert "when to show sections" in with_activity["included"]
+
+
+def test_digest_trims_lists_to_budget(stats, guidelines):
+    stats["recent_activity"] = [
+        {"icon": "📝", "description": f"Pushed to repo-{i}", "date": "2025-01-01"} for i in range(40)
+    ]
+    full = build_digest(stats, guidelines, budget=100000)
+    budget = full["chars"] - len(full["text"].split("## Guidelines", 1)[1]) - 300
+
+    digest = build_digest(stats, guidelines, budget=budget)
+
+    assert digest["chars"] <= budget and not digest["over_budget"]
+    assert digest["trimmed"] > 0
+    assert "Pushed to repo-0" in digest["text"] and "Pushed to repo-39" not in digest["text"]
+    assert '"langs":["Python:3","HCL:1"]' in digest["text"]  # Activity goes first
+
+
+def test_digest_tiny_budget_flagged(stats, guidelines):
+    digest = build_digest(stats, guidelines, budget=0)
+
+    assert not digest["included"]
+    assert digest["over_budget"]
+    assert "![Python](https://img.shields.io/badge/Python-3776AB" in digest["text"]
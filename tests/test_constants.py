@@ -0,0 +1,81 @@
+"""Tests for the badge helpers and the offline Simple Icons index."""
+
+import json
+
+import build_icon_index
+import constants
+
+
+def test_constants_configured():
+    assert constants.COMMON_TECH, "COMMON_TECH is empty"
+    assert constants.SOCIAL_LINKS, "SOCIAL_LINKS is empty"
+
+
+def test_skill_badge():
+    badge = constants.get_skill_badge("Python", "python", "3776AB")
+    assert badge.startswith("![Python](https://img.shields.io/badge/Python-3776AB")
+    assert "logo=python" in badge
+
+
+def test_badge_names_are_escaped_for_shields():
+    expected = {"C#": "C%23-", "Objective-C": "Objective--C-", "C++": "C%2B%2B-",
+                "snake_case": "snake__case-", "Vim Script": "Vim%20Script-"}
+    for name, path in expected.items():
+        badge = constants.get_language_badge(name)
+        assert f"img.shields.io/badge/{path}" in badge, badge
+
+
+def test_social_badge():
+    badge = constants.get_social_badge("Twitter", "me", "https://twitter.com/me")
+    assert 'href="https://twitter.com/me"' in badge
+    assert f"style={constants.DEFAULT_BADGE_STYLE}" in badge
+
+
+def test_index_is_a_pinned_release():
+    with open(constants.SIMPLE_ICONS_FILE) as f:
+        data = json.load(f)
+
+    assert data["release"] and data["release"] in data["source"]
+    assert len(data["icons"]) > 2000  # The whole release, not a hand-picked subset
+    assert "java" not in data["icons"]  # Removed upstream before this release
+    assert {"coder", "cursor"} <= set(data["icons"])  # Added in releases shields.io bundles
+
+
+def test_reference_slugs_exist():
+    index = constants.get_icon_index()
+    slugs = [slug for category in constants.COMMON_TECH.values() for slug, _ in category.values()]
+    slugs += list(constants.LANGUAGE_ICON_ALIASES.values())
+    slugs += [slug for slug, _ in constants.SOCIAL_PLATFORMS.values()]
+    missing = [slug for slug in slugs if slug != "none" and slug not in index]
+    assert not missing, f"Slugs missing from simple-icons {constants.SIMPLE_ICONS_FILE.name}: {missing}"
+
+
+def test_build_index_derives_missing_slugs():
+    entries = [{"title": "Node.js", "hex": "339933"}, {"title": "Vue.js", "slug": "vuedotjs", "hex": "4fc08d"}]
+    assert build_icon_index.build_index(entries) == {"nodedotjs": "339933", "vuedotjs": "4FC08D"}
+
+
+def test_data_file_layouts():
+    entry = {"title": "Coder", "hex": "090B0B"}
+    assert build_icon_index.parse_entries([entry]) == [entry]
+    assert build_icon_index.parse_entries({"icons": [entry]}) == [entry]
+    assert build_icon_index.parse_entries({"coder": entry}) == [{"slug": "coder", **entry}]
+
+
+def test_resolve_icon():
+    expected = {"Vue": "vuedotjs", "HCL": "terraform", "Dockerfile": "docker",
+                "Shell": "gnubash", "Node.js": "nodedotjs", "C++": "cplusplus"}
+    for language, slug in expected.items():
+        assert constants.resolve_icon(language)[0] == slug, language
+
+
+def test_unknown_icons_are_not_guessed():
+    assert not constants.is_simple_icon_available("notarealicon")
+    assert constants.resolve_icon("Objective-J") is None
+    assert "logo=" not in constants.get_language_badge("Objective-J")
+
+
+def test_detected_languages_resolve(github_data):
+    languages = {repo["language"] for repo in github_data["repos"] if repo.get("language")}
+    unresolved = [language for language in sorted(languages) if not constants.resolve_icon(language)]
+    assert not unresolved, f"Detected languages without icons: {unresolved}"
@@ -0,0 +1,38 @@
+"""Environment and repository checks (formerly the first half of test_generation.py)."""
+
+import json
+from datetime import datetime
+
+from tests.conftest import ROOT
+
+
+def test_imports():
+    """All required third-party packages import."""
+    import requests  # noqa: F401
+    from github import Github  # noqa: F401
+
+
+def test_data_directory_writable(tmp_path):
+    """A data directory can be created and written to (in a temp dir, not the real data/)."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir(exist_ok=True)
+
+    test_file = data_dir / "test.json"
+    with open(test_file, "w") as f:
+        json.dump({"test": True, "timestamp": datetime.utcnow().isoformat()}, f)
+    assert json.loads(test_file.read_text())["test"] is True
+
+
+def test_readme_structure():
+    """The committed README has a heading, links and images."""
+    readme = ROOT / "README.md"
+    if not readme.exists():
+        return
+
+    content = readme.read_text(encoding="utf-8")
+    lines = content.split("\n")
+
+    assert any(line.startswith("# ") or line.startswith("<h1") for line in lines), "No H1 heading found"
+    assert "](" in content, "No markdown links found"
+    assert "![" in content or "<img" in content, "No images found"
+    assert len(lines) >= 20, "README seems short"
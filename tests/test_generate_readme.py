@@ -0,0 +1,263 @@
+"""Tests for data fetching and statistics in generate_readme.py."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import generate_readme
+from tests.stub_api import StubAPI
+
+
+@pytest.mark.budget(1.0)
+def test_fetch_github_data(stub_api, github_data):
+    data = generate_readme.fetch_github_data()
+
+    assert data["user"]["login"] == github_data["user"]["login"]
+    assert len(data["repos"]) == len(github_data["repos"])
+    assert len(data["events"]) == len(github_data["events"])
+
+
+@pytest.mark.budget(1.0)
+def test_readme_generation(stub_api, data_dir):
+    status = generate_readme.generate_readme(generate_readme.fetch_github_data())
+
+    assert len(status) > 100
+    stats = json.loads((data_dir / "github_stats.json").read_text())
+    assert stats["user"]["username"] == "DevelopmentCats"
+    assert "Python" in stats["languages"]["all_detected"]
+    assert stats["recent_activity"]
+    assert stats["featured_repos"] and "Python" in stats["repo_index"]["languages"]
+    assert (data_dir / "ai_digest.md").exists()
+    assert (data_dir / "section_manifest.json").exists()
+
+
+@pytest.mark.budget(1.0)
+def test_pipeline_matches_sequential_run(stub_api, data_dir):
+    assert generate_readme.main([]) == 0
+    stats = json.loads((data_dir / "github_stats.json").read_text())
+    raw = json.loads((data_dir / "github_data.json").read_text())
+
+    generate_readme.generate_readme(raw)
+    expected = json.loads((data_dir / "github_stats.json").read_text())
+    stats.pop("updated_at")
+    expected.pop("updated_at")
+    assert stats == expected
+
+    # Same API data: only fetches and the write stage execute again
+    result = generate_readme.run_pipeline(
+        generate_readme.build_pipeline(), cache_dir=data_dir / ".pipeline_cache", verbose=False
+    )
+    statuses = {entry["name"]: entry["status"] for entry in result["timeline"]}
+    assert statuses["language_stats"] == statuses["activity"] == statuses["render"] == "cached"
+    assert statuses["fetch_events"] == statuses["write"] == "ran"
+
+
+@pytest.mark.budget(1.0)
+def test_fresh_resources_served_from_cache(stub_api, data_dir, capsys):
+    def fetched_paths():
+        paths = sorted(request["path"].rsplit("/", 1)[-1] for request in stub_api.requests)
+        stub_api.requests.clear()
+        return paths
+
+    assert generate_readme.main([]) == 0
+    assert fetched_paths() == ["DevelopmentCats", "public", "repos"]
+    raw = json.loads((data_dir / "github_data.json").read_text())
+    assert set(raw["fetched"]) == {"user", "repos", "events"}
+
+    # Profile and repos are within their TTLs; events are always refreshed
+    assert generate_readme.main([]) == 0
+    assert fetched_paths() == ["public"]
+    assert "2 of 3 resources served from cache (repos, user)" in capsys.readouterr().out
+    assert json.loads((data_dir / "github_data.json").read_text())["fetched"]["user"] == raw["fetched"]["user"]
+
+    assert generate_readme.main(["--force"]) == 0
+    assert fetched_paths() == ["DevelopmentCats", "public", "repos"]
+
+
+def test_fetch_resource_ttl(monkeypatch):
+    now = datetime(2025, 1, 10, tzinfo=timezone.utc)
+    cached = {"data": {"login": "cached"}, "fetched_at": "2025-01-09T12:00:00+00:00"}
+    monkeypatch.setitem(generate_readme.RESOURCE_FETCHERS, "user", lambda: {"login": "fresh"})
+
+    hit = generate_readme.fetch_resource("user", cached, ttl=86400, now=now)
+    assert hit["source"] == "cache" and hit["data"]["login"] == "cached"
+    assert hit["age"] == 12 * 3600
+
+    for kwargs in ({"ttl": 3600}, {"ttl": 86400, "force": True}):
+        miss = generate_readme.fetch_resource("user", cached, now=now, **kwargs)
+        assert miss["source"] == "api" and miss["data"]["login"] == "fresh"
+    assert generate_readme.fetch_resource("user", None, now=now)["source"] == "api"
+
+
+def test_language_stats_skip_forks(github_data):
+    languages = generate_readme.get_language_stats(github_data["repos"])
+
+    assert "TypeScript" not in languages  # Only used by a fork
+    assert list(languages)[0] == "JavaScript"
+
+
+def test_tracked_repo_matcher():
+    patterns = ["coder/registry", "coder/*", "coder/code-*", "coder/code-server*"]
+    matcher = generate_readme.compile_repo_patterns(patterns)
+
+    expected = {
+        "coder/registry": "coder/registry",
+        "Coder/Registry": "coder/registry",
+        "coder/registry-foo": "coder/*",
+        "coder/code-marketplace": "coder/code-*",
+        "coder/code-server": "coder/code-server*",
+        "coderx/registry": None,
+        "other/registry": None,
+    }
+    for repo, pattern in expected.items():
+        assert generate_readme.match_repo(matcher, repo) == pattern, repo
+
+
+def test_tracked_repo_patterns_rejected():
+    with pytest.raises(ValueError):
+        generate_readme.compile_repo_patterns(["coder"])
+    with pytest.raises(ValueError):
+        generate_readme.compile_repo_patterns(["coder/*-server"])
+
+
+def test_tracked_repo_stats(github_data):
+    stats = generate_readme.get_tracked_repo_stats(github_data["events"], ["coder/registry", "coder/*"])
+
+    assert stats["coder/registry"]["total_prs"] == 2
+    assert stats["coder/registry"]["total_commits"] == 1
+    assert stats["coder/registry"]["total_issues"] == 0  # coder/registry-foo isn't coder/registry
+    assert stats["coder/*"]["total_issues"] == 1
+
+
+def test_recent_activity_ranking():
+    def push(n, repo="me/app"):
+        return {"id": f"p{n}-{repo}", "type": "PushEvent", "repo": {"name": repo},
+                "created_at": f"2025-01-10T{n:02d}:00:00Z",
+                "payload": {"commits": [{"sha": "a"}, {"sha": "b"}]}}
+
+    events = [push(n) for n in range(20, 5, -1)] + [
+        {"id": "r1", "type": "ReleaseEvent", "repo": {"name": "me/lib"},
+         "created_at": "2025-01-10T05:00:00Z",
+         "payload": {"release": {"tag_name": "v1.0", "html_url": "https://x/r"}}},
+        {"id": "m1", "type": "PullRequestEvent", "repo": {"name": "me/lib"},
+         "created_at": "2025-01-10T04:00:00Z",
+         "payload": {"action": "merged", "pull_request": {"number": 7}}},
+        push(3, repo="me/other"),
+        push(3, repo="me/other"),  # Duplicate event id
+    ]
+    now = datetime(2025, 1, 10, 21, tzinfo=timezone.utc)
+
+    activity = generate_readme.get_recent_activity(events, limit=3, now=now)
+
+    assert [item["type"] for item in activity] == ["release", "pr", "push"]
+    assert activity[1]["url"] == "https://github.com/me/lib/pull/7"
+    assert activity[2]["pushes"] == 15 and activity[2]["commits"] == 30
+    assert activity[2]["description"] == "Pushed 30 commit(s) to me/app"
+    assert len(generate_readme.get_recent_activity(events, limit=10, now=now)) == 4
+
+
+def test_trimmed_push_payloads_count_pushes():
+    # Current feeds only carry before/head for pushes: no commits list or size
+    def push(n, payload):
+        return {"id": f"p{n}", "type": "PushEvent", "repo": {"name": "coder/coder"},
+                "created_at": f"2025-01-10T{n:02d}:00:00Z", "payload": payload}
+
+    trimmed = {"ref": "refs/heads/main", "head": "b" * 40, "before": "a" * 40, "push_id": 1}
+    events = [push(n, trimmed) for n in range(12, 5, -1)]
+    events.insert(3, push(13, {"size": 4}))
+    now = datetime(2025, 1, 10, 21, tzinfo=timezone.utc)
+
+    activity = generate_readme.get_recent_activity(events, now=now)
+
+    assert len(activity) == 1
+    assert activity[0]["pushes"] == 8 and activity[0]["commits"] is None
+    assert activity[0]["description"] == "8 pushes to coder/coder"
+    assert "commit" not in activity[0]["description"]
+
+
+def test_recent_activity_weights_configurable(github_data):
+    now = datetime(2025, 12, 13, tzinfo=timezone.utc)
+    weights = dict(generate_readme.ACTIVITY_WEIGHTS, push=100.0)
+
+    activity = generate_readme.get_recent_activity(github_data["events"], limit=1, weights=weights, now=now)
+
+    assert activity[0]["type"] == "push"
+
+
+def test_featured_repos_ranking():
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+    def repo(name, stars=0, forks=0, pushed="2025-05-31T00:00:00Z", topics=(), language="Go", **extra):
+        return dict(name=name, stargazers_count=stars, forks_count=forks, pushed_at=pushed,
+                    topics=list(topics), language=language, html_url=f"https://github.com/x/{name}",
+                    **extra)
+
+    repos = [
+        repo("popular", stars=50, forks=5, pushed="2024-01-01T00:00:00Z"),
+        repo("coder-module", stars=2, topics=["coder", "terraform"], language="HCL"),
+        repo("fresh", stars=2),
+        repo("stale", stars=2, pushed="2023-01-01T00:00:00Z", topics=["cli"]),
+        repo("forked", stars=500, fork=True),
+        repo("old", stars=500, archived=True),
+        repo("DevelopmentCats", stars=500, language="Python"),
+    ]
+    result = generate_readme.get_featured_repos(repos, limit=3, now=now)
+
+    names = [featured["name"] for featured in result["featured"]]
+    assert names == ["popular", "coder-module", "fresh"]
+    assert result["featured"][0]["stars"] == 50
+    assert result["index"] == {
+        "topics": {"coder": ["coder-module"], "terraform": ["coder-module"], "cli": ["stale"]},
+        "languages": {"Go": ["popular", "fresh", "stale"], "HCL": ["coder-module"]},
+    }
+
+    # Topic matches are configurable
+    names = [r["name"] for r in generate_readme.get_featured_repos(repos, limit=1, topics=["cli"],
+                                                                   weights={"topic": 1.0}, now=now)["featured"]]
+    assert names == ["stale"]
+    assert generate_readme.get_featured_repos(repos, limit=0, now=now)["featured"] == []
+
+
+@pytest.mark.budget(1.0)
+def test_registry_backfill(tmp_path, monkeypatch):
+    prs = [
+        {"number": n, "title": f"PR {n}", "state": "closed", "html_url": f"https://x/{n}",
+         "created_at": f"2025-01-{n % 28 + 1:02d}T00:00:00Z", "updated_at": "2025-02-01T00:00:00Z",
+         "pull_request": {"merged_at": "2025-02-01T00:00:00Z"}}
+        for n in range(1, 151)
+    ]
+    commits = [{"sha": "abcdef1234", "html_url": "https://x/c",
+                "commit": {"message": "feat: add module\n\nbody",
+                           "committer": {"date": "2025-01-05T00:00:00Z"}}}]
+
+    def search(items_for):
+        def handler(query, headers):
+            q = query["q"][0]
+            page, per_page = int(query["page"][0]), int(query["per_page"][0])
+            items = [] if ("updated:>=" in q or "committer-date:>=" in q) else items_for(q)
+            return 200, {}, {"total_count": len(items),
+                             "items": items[(page - 1) * per_page:page * per_page]}
+        return handler
+
+    api = StubAPI({
+        "/search/issues": search(lambda q: prs if "is:pr" in q else []),
+        "/search/commits": search(lambda q: commits),
+    }).start()
+    monkeypatch.setattr(generate_readme, "GITHUB_API", api.url)
+
+    try:
+        index_file = tmp_path / "registry_index.json"
+        generate_readme.backfill_registry_index("coder/registry", "DevelopmentCats", index_file=index_file)
+        index = generate_readme.backfill_registry_index(
+            "coder/registry", "DevelopmentCats",
+            index=generate_readme.load_registry_index(index_file), index_file=index_file
+        )
+    finally:
+        api.stop()
+
+    stats = generate_readme.get_coder_registry_stats([], [], index)
+    assert stats["total_prs"] == 150
+    assert stats["total_commits"] == 1
+    assert stats["commits"][0]["message"] == "feat: add module"
+    assert any("updated:>=" in request["query"]["q"][0] for request in api.requests)
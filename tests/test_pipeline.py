@@ -0,0 +1,92 @@
+"""Tests for the DAG pipeline executor."""
+
+import time
+
+import pytest
+
+from pipeline import Stage, order_stages, run_pipeline
+
+
+@pytest.mark.budget(1.0)
+def test_independent_stages_run_concurrently(tmp_path):
+    def slow(value):
+        def run(inputs):
+            time.sleep(0.2)
+            return value
+        return run
+
+    stages = [
+        Stage("a", slow(1), cache=False),
+        Stage("b", slow(2), cache=False),
+        Stage("sum", lambda inputs: inputs["a"] + inputs["b"], deps=["a", "b"]),
+    ]
+    result = run_pipeline(stages, cache_dir=tmp_path, verbose=False)
+
+    timeline = {entry["name"]: entry for entry in result["timeline"]}
+    assert result["outputs"]["sum"] == 3
+    assert timeline["b"]["start"] < timeline["a"]["end"]
+    assert timeline["a"]["start"] < timeline["b"]["end"]
+    assert timeline["sum"]["start"] >= max(timeline["a"]["end"], timeline["b"]["end"])
+
+
+def test_only_changed_stages_rerun(tmp_path):
+    calls = []
+    source = {"value": 1}
+
+    def stages(scale=10):
+        return [
+            Stage("fetch", lambda inputs: source["value"], cache=False),
+            Stage("constant", lambda inputs: calls.append("constant") or "x"),
+            Stage("scaled", lambda inputs: calls.append("scaled") or inputs["fetch"] * scale,
+                  deps=["fetch"], params={"scale": scale}),
+        ]
+
+    def statuses(result):
+        return {entry["name"]: entry["status"] for entry in result["timeline"]}
+
+    first = run_pipeline(stages(), cache_dir=tmp_path, verbose=False)
+    assert first["outputs"]["scaled"] == 10
+    assert calls == ["constant", "scaled"] or calls == ["scaled", "constant"]
+
+    calls.clear()
+    second = run_pipeline(stages(), cache_dir=tmp_path, verbose=False)
+    assert calls == []
+    assert statuses(second) == {"fetch": "ran", "constant": "cached", "scaled": "cached"}
+    assert second["outputs"] == first["outputs"]
+
+    # Changed input and changed params both invalidate the stage
+    source["value"] = 2
+    assert run_pipeline(stages(), cache_dir=tmp_path, verbose=False)["outputs"]["scaled"] == 20
+    assert run_pipeline(stages(3), cache_dir=tmp_path, verbose=False)["outputs"]["scaled"] == 6
+    assert calls == ["scaled", "scaled"]
+
+    calls.clear()
+    run_pipeline(stages(3), cache_dir=tmp_path, force=True, verbose=False)
+    assert sorted(calls) == ["constant", "scaled"]
+
+
+def test_failed_stage_skips_dependents(tmp_path, capsys):
+    def fail(inputs):
+        raise RuntimeError("boom")
+
+    stages = [
+        Stage("fail", fail, cache=False),
+        Stage("after", lambda inputs: 1, deps=["fail"]),
+    ]
+    with pytest.raises(RuntimeError, match="boom"):
+        run_pipeline(stages, cache_dir=tmp_path)
+
+    timeline = capsys.readouterr().out
+    assert "failed" in timeline and "skipped" in timeline
+
+
+def test_invalid_graphs_rejected():
+    with pytest.raises(ValueError, match="unknown"):
+        order_stages([Stage("a", lambda inputs: 1, deps=["missing"])])
+    with pytest.raises(ValueError, match="cycle"):
+        order_stages([
+            Stage("a", lambda inputs: 1, deps=["b"]),
+            Stage("b", lambda inputs: 1, deps=["a"]),
+        ])
+    with pytest.raises(ValueError, match="Duplicate"):
+        order_stages([Stage("a", lambda inputs: 1), Stage("a", lambda inputs: 2)])
@@ -0,0 +1,129 @@
+"""Tests for the content-addressed README section cache."""
+
+import pytest
+
+import section_cache
+from section_cache import SECTIONS, build_manifest, accept, prune, split_readme, render_salt
+from tests.conftest import ROOT
+
+README = "\n".join([
+    "<h1>Hi</h1>",
+    "## 🚀 What I'm Working On",
+    "Registry modules",
+    "## 🛠️ Tech Stack",
+    "![Python](badge)",
+    "## 🎲 Fun Facts",
+    "Kept with the section above",
+    "## 📊 GitHub Stats",
+    "<img src='stats' />",
+    "## 🤝 Connect With Me",
+    "badges",
+])
+
+
+@pytest.fixture
+def stats():
+    return {
+        "user": {"username": "DevelopmentCats", "name": "DevCats", "public_repos": 60},
+        "tracked_projects": {"coder/registry": {"total_prs": 3}},
+        "recent_activity": [{"description": "Pushed 1 commit(s) to me/app"}],
+        "languages": {"all_detected": ["Python"], "top_8": ["Python"], "total_count": 1},
+    }
+
+
+def test_split_readme():
+    parts = split_readme(README)
+
+    assert set(parts) == {"header", "working_on", "tech_stack", "github_stats", "connect"}
+    assert "Fun Facts" in parts["tech_stack"]
+
+
+def test_split_real_readme():
+    parts = split_readme((ROOT / "README.md").read_text(encoding="utf-8"))
+
+    assert set(parts) == {section["name"] for section in SECTIONS} - {"activity", "featured"}
+    assert parts["highlights"].startswith("## 🌟 Highlights")
+    assert "Development Philosophy" not in parts["highlights"]
+    assert not any(section_cache.has_unknown_heading(markdown) for markdown in parts.values())
+
+
+def test_repo_count_regenerates_sections_showing_it(stats):
+    cache = {}
+    stored = accept((ROOT / "README.md").read_text(encoding="utf-8"), build_manifest(stats, cache), cache)
+
+    stats["user"]["public_repos"] = 75
+    regenerate = build_manifest(stats, cache)["regenerate"]
+
+    # Sections the README doesn't have were never cached, so only check accepted ones
+    assert [name for name in regenerate if name in stored] == [
+        "header", "working_on", "github_stats", "highlights"
+    ]
+
+
+def test_unknown_heading_cached_on_full_stats(stats):
+    cache = {}
+    accept(README, build_manifest(stats, cache), cache)
+
+    stats["recent_activity"].append({"description": "Opened a PR"})
+    regenerate = build_manifest(stats, cache)["regenerate"]
+
+    # tech_stack swallowed "Fun Facts", so any stats change regenerates it
+    assert "tech_stack" in regenerate and "working_on" not in regenerate
+
+
+def test_only_changed_sections_regenerate(stats):
+    cache = {}
+    first = build_manifest(stats, cache)
+    assert first["regenerate"] == [section["name"] for section in first["sections"]]
+
+    stored = accept((ROOT / "README.md").read_text(encoding="utf-8"), first, cache)
+    assert "activity" not in stored
+
+    stats["languages"]["all_detected"].append("Go")
+    second = build_manifest(stats, cache)
+    assert [name for name in second["regenerate"] if name in stored] == ["tech_stack", "highlights"]
+    assert set(second["regenerate"]) - set(stored) == {"activity", "featured"}  # Never accepted
+
+    hit = next(section for section in second["sections"] if section["name"] == "connect")
+    assert hit["status"] == "hit" and hit["markdown"].startswith("## 🤝 Connect With Me")
+
+
+def test_featured_ranking_regenerates_featured_section(stats):
+    stats["featured_repos"] = [{"name": "app", "stars": 3, "score": 4.2}, {"name": "cli", "stars": 1, "score": 2.0}]
+    readme = README.replace("## 📊 GitHub Stats", "## ⭐ Featured Projects\n- app\n- cli\n## 📊 GitHub Stats")
+    cache = {}
+    assert "featured" in accept(readme, build_manifest(stats, cache), cache)
+
+    # Scores decay daily without changing what the section shows
+    for repo in stats["featured_repos"]:
+        repo["score"] /= 2
+    assert "featured" not in build_manifest(stats, cache)["regenerate"]
+
+    stats["featured_repos"].reverse()
+    assert "featured" in build_manifest(stats, cache)["regenerate"]
+
+
+def test_salt_invalidates_everything(stats):
+    cache = {}
+    accept(README, build_manifest(stats, cache), cache)
+
+    assert len(build_manifest(stats, cache, salt="new guidelines")["regenerate"]) == len(SECTIONS)
+
+
+def test_salt_covers_badge_helpers(tmp_path):
+    files = [tmp_path / name for name in ("ai_guidelines.md", "constants.py", "simple_icons.json")]
+    for path in files:
+        path.write_text("v1")
+    before = render_salt(files)
+
+    files[2].write_text('{"icons": {}}')
+    assert render_salt(files) != before
+    assert [path.name for path in section_cache.SALT_FILES] == [path.name for path in files]
+
+
+def test_prune_keeps_newest():
+    cache = {str(i): {"section": "header", "markdown": "", "accepted_at": f"2025-01-0{i}"} for i in range(1, 8)}
+
+    prune(cache, keep=2)
+
+    assert set(cache) == {"6", "7"}
@@ -0,0 +1,125 @@
+"""Tests for the in-memory stats server and load-test client."""
+
+import json
+import asyncio
+
+import pytest
+
+import stats_server
+import generate_readme
+from stats_server import StatsServer
+from load_test import request, run_load_test
+
+# Tests run a live server on a local port; keep them well under the default budget
+pytestmark = pytest.mark.budget(1.0)
+
+
+def serve(stats_file, scenario):
+    """Run a scenario coroutine against a server on an ephemeral port."""
+    async def main():
+        server = StatsServer(stats_file, stats_file.parent / "missing.json")
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            return await scenario(server, port, reader, writer)
+        finally:
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def stats_file(tmp_path):
+    path = tmp_path / "github_stats.json"
+    path.write_text(json.dumps({"languages": {"all_detected": ["Python", "C#", "C"], "by_repo_count": {"Python": 2}}}))
+    return path
+
+
+def test_etag_and_304(stats_file):
+    async def scenario(server, port, reader, writer):
+        first = await request(reader, writer, "localhost", "/stats/languages")
+        cached = await request(reader, writer, "localhost", "/stats/languages", first["headers"]["etag"])
+        return first, cached
+
+    first, cached = serve(stats_file, scenario)
+
+    assert first["status"] == 200
+    assert "max-age" in first["headers"]["cache-control"]
+    assert cached["status"] == 304 and cached["body"] == b""
+
+
+def test_badges_cards_and_404(stats_file):
+    async def scenario(server, port, reader, writer):
+        return [
+            (await request(reader, writer, "localhost", path))
+            for path in ("/badge/python.svg", "/badge/csharp.svg", "/badge/c.svg", "/card/languages.svg", "/nope")
+        ]
+
+    badge, csharp, c, card, missing = serve(stats_file, scenario)
+
+    assert badge["status"] == 200 and b"#3776AB" in badge["body"]
+    assert b">C#<" in csharp["body"] and b">C<" in c["body"]
+    assert card["headers"]["content-type"] == "image/svg+xml"
+    assert missing["status"] == 404
+
+
+def test_hot_reload(stats_file):
+    async def scenario(server, port, reader, writer):
+        first = await request(reader, writer, "localhost", "/stats/languages")
+        stats_file.write_text(json.dumps({"languages": {"all_detected": ["Go"]}}))
+        server.reload_if_changed()
+        return await request(reader, writer, "localhost", "/stats/languages", first["headers"]["etag"])
+
+    reloaded = serve(stats_file, scenario)
+
+    assert reloaded["status"] == 200 and b"Go" in reloaded["body"]
+
+
+def test_load_test_against_server(stats_file):
+    async def scenario(server, port, reader, writer):
+        return await run_load_test(f"http://127.0.0.1:{port}", ["/stats"], connections=20, requests=400)
+
+    result = serve(stats_file, scenario)
+
+    assert result["requests"] == 400
+    assert set(result["statuses"]) <= {200, 304}
+
+
+def test_request_body_is_not_parsed_as_a_request(stats_file):
+    smuggled = b"GET /stats HTTP/1.1\r\nHost: x\r\n\r\n"
+
+    async def scenario(server, port, reader, writer):
+        writer.write(
+            b"POST /stats HTTP/1.1\r\nHost: x\r\n"
+            + f"Content-Length: {len(smuggled)}\r\n\r\n".encode() + smuggled
+        )
+        await writer.drain()
+        return await asyncio.wait_for(reader.read(), 5)
+
+    response = serve(stats_file, scenario)
+
+    assert response.startswith(b"HTTP/1.1 405 ")
+    assert b"Connection: close" in response
+    assert response.count(b"HTTP/1.1 ") == 1
+
+
+def test_idle_connection_is_closed(stats_file, monkeypatch):
+    monkeypatch.setattr(stats_server, "IDLE_TIMEOUT", 0.1)
+
+    async def scenario(server, port, reader, writer):
+        return await asyncio.wait_for(reader.read(), 5)
+
+    assert serve(stats_file, scenario) == b""
+
+
+def test_serve_passes_host_and_port(monkeypatch):
+    calls = []
+    monkeypatch.setattr(stats_server, "main", lambda argv: calls.append(argv) or 0)
+
+    generate_readme.main(["--serve", "--host", "0.0.0.0", "--port", "9000"])
+    generate_readme.main(["--serve"])
+
+    assert calls == [["--host", "0.0.0.0", "--port", "9000"], []]
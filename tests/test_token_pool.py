@@ -0,0 +1,134 @@
+"""Tests for the multi-token pool, against a stub API with per-token limits."""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import generate_readme
+from token_pool import TokenPool, TokenPoolExhausted
+from tests.stub_api import StubAPI
+
+
+def rate_limited(limits, reset_in=3600, delay=0.0):
+    """
+    Route handler enforcing a request limit per token, like GitHub's core quota.
+
+    Each response is held back ``delay`` seconds, so concurrent requests are
+    all in flight before any quota is reported. Response statuses are
+    recorded on the handler's ``statuses`` list.
+    """
+    remaining = dict(limits)
+    reset = int(time.time()) + reset_in
+    lock = threading.Lock()
+
+    def respond(token):
+        if token not in remaining:
+            return 401, {}, {"message": "Bad credentials"}
+        rate_headers = {"X-RateLimit-Limit": limits[token], "X-RateLimit-Reset": reset,
+                        "X-RateLimit-Resource": "core"}
+        if remaining[token] <= 0:
+            return 403, dict(rate_headers, **{"X-RateLimit-Remaining": 0}), {"message": "rate limited"}
+        remaining[token] -= 1
+        return 200, dict(rate_headers, **{"X-RateLimit-Remaining": remaining[token]}), {"token": token}
+
+    def handler(query, headers):
+        time.sleep(delay)
+        with lock:
+            response = respond(headers.get("authorization", "").replace("token ", ""))
+            handler.statuses.append(response[0])
+        return response
+
+    handler.statuses = []
+    return handler
+
+
+@pytest.fixture
+def limited_api(request, monkeypatch):
+    """Stub /rate endpoint; rate_limited() arguments can be overridden with indirect parametrization."""
+    options = getattr(request, "param", {"limits": {"alpha": 3, "beta": 5}})
+    api = StubAPI({"/rate": rate_limited(**options)}).start()
+    monkeypatch.setattr(generate_readme, "GITHUB_API", api.url)
+    monkeypatch.setattr(generate_readme, "TOKEN_POOL", TokenPool(["alpha", "beta"]))
+    yield api
+    api.stop()
+
+
+def test_pool_from_env():
+    pool = TokenPool.from_env({"GITHUB_TOKENS": "a, b\nc", "GITHUB_TOKEN": "a"})
+    assert pool.tokens == ["a", "b", "c"]
+    assert len(TokenPool.from_env({})) == 0
+    assert TokenPool([]).acquire() is None
+
+
+def test_routes_to_most_headroom_and_skips_exhausted():
+    pool = TokenPool(["a", "b"])
+    reset = time.time() + 60
+    pool.update("a", {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(reset)})
+    pool.update("b", {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset)})
+
+    assert pool.acquire() == "a"
+
+    pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+    assert pool.acquire() == "b"
+    assert pool.acquire() == "b"  # Reserved down to 0
+    with pytest.raises(TokenPoolExhausted):
+        pool.acquire()
+
+    # Search quota is tracked separately, and a reset restores a token
+    assert pool.acquire("search") in ("a", "b")
+    pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() - 1)})
+    assert pool.acquire() == "a"
+
+
+def test_unknown_tokens_share_a_burst():
+    pool = TokenPool(["a", "b"])
+    assert sorted(pool.acquire() for _ in range(4)) == ["a", "a", "b", "b"]
+
+    # The first response reports the limit; requests still in flight count against it
+    reset = time.time() + 60
+    pool.update("a", {"X-RateLimit-Limit": "3", "X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset)})
+    assert [pool.acquire(), pool.acquire()] == ["a", "b"]
+    with pytest.raises(TokenPoolExhausted):
+        pool.acquire()
+
+
+def test_secondary_rate_limit_benches_token():
+    pool = TokenPool(["a", "b"])
+    pool.update("a", {"Retry-After": "60"}, status=403)
+    assert pool.is_exhausted("a")
+    assert pool.acquire() == "b"
+
+
+@pytest.mark.budget(1.0)
+def test_github_get_spreads_load_across_tokens(limited_api):
+    used = [generate_readme.github_get("/rate")["token"] for _ in range(8)]
+
+    assert used.count("alpha") == 3 and used.count("beta") == 5
+    with pytest.raises(TokenPoolExhausted):
+        generate_readme.github_get("/rate")
+    assert {quota["remaining"] for quota in generate_readme.TOKEN_POOL.status()} == {0}
+
+
+@pytest.mark.budget(1.0)
+@pytest.mark.parametrize("limited_api", [{"limits": {"alpha": 4, "beta": 4}, "delay": 0.1}], indirect=True)
+def test_concurrent_startup_spreads_over_unknown_tokens(limited_api):
+    # No quota is known yet, so each token may only get its fair share
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        used = list(pool.map(lambda _: generate_readme.github_get("/rate")["token"], range(8)))
+
+    assert sorted(used) == ["alpha"] * 4 + ["beta"] * 4
+    assert limited_api.routes["/rate"].statuses == [200] * 8  # Nothing was sent to an exhausted token
+
+
+@pytest.mark.budget(1.0)
+def test_concurrent_requests_use_full_quota(limited_api):
+    generate_readme.github_get("/rate")  # Learn both quotas first
+    generate_readme.github_get("/rate")
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        used = list(pool.map(lambda _: generate_readme.github_get("/rate")["token"], range(6)))
+
+    assert sorted(used) == ["alpha"] * 2 + ["beta"] * 4
+    assert limited_api.routes["/rate"].statuses == [200] * 8
@@ -0,0 +1,87 @@
+"""Tests for the README link and image validator."""
+
+import pytest
+
+import validate_links
+from tests.stub_api import StubAPI
+
+
+@pytest.fixture
+def asset_server():
+    """Image/link host where everything but /good.svg and /profile is a 404."""
+    api = StubAPI({"/good.svg": {}, "/profile": {}}).start()
+    yield api
+    api.stop()
+
+
+def test_extract_urls_single_pass():
+    content = "\n".join([
+        "![Good](https://img.shields.io/a)",
+        '<img src="https://img.shields.io/b" alt="B" />',
+        '<a href="https://twitter.com/me"><img src="https://img.shields.io/a" /></a>',
+        "[Mail](mailto:someone@example.com)",
+    ])
+
+    urls = validate_links.extract_urls(content)
+
+    assert urls["images"] == ["https://img.shields.io/a", "https://img.shields.io/b"]
+    assert urls["links"] == ["https://twitter.com/me", "mailto:someone@example.com"]
+
+
+def test_extract_urls_badge_links():
+    urls = validate_links.extract_urls(
+        "[![T](https://img.shields.io/x)](https://twitter.com/me) [plain](https://example.com)"
+    )
+
+    assert urls["images"] == ["https://img.shields.io/x"]
+    assert urls["links"] == ["https://twitter.com/me", "https://example.com"]
+
+
+def test_untrusted_image_inside_link_rejected(monkeypatch):
+    monkeypatch.setattr(validate_links, "probe_url", lambda url, timeout: {"ok": True, "status": 200})
+    report = validate_links.validate_readme(
+        "[![E](https://evil.example.com/x.png)](https://twitter.com/me)", check_links=False
+    )
+
+    assert any("not a trusted service" in error for error in report["errors"])
+
+
+def test_trusted_hosts():
+    assert validate_links.is_trusted_host("https://img.shields.io/badge/x")
+    assert validate_links.is_trusted_host("https://github-readme-stats.vercel.app/api")
+    assert not validate_links.is_trusted_host("https://evilshields.io/x")
+    assert not validate_links.is_trusted_host("http://127.0.0.1/x")
+
+
+@pytest.mark.budget(1.0)
+def test_validate_readme_with_cache(asset_server, monkeypatch):
+    base = asset_server.url
+    monkeypatch.setattr(validate_links, "TRUSTED_SERVICES", validate_links.TRUSTED_SERVICES + ["127.0.0.1"])
+    content = "\n".join([
+        f"![Good]({base}/good.svg)",
+        f'<img src="{base}/missing.svg" alt="Broken" />',
+        f'<a href="{base}/profile"><img src="{base}/good.svg" /></a>',
+    ])
+
+    cache = {}
+    report = validate_links.validate_readme(content, cache=cache, max_workers=4)
+    probes = len(asset_server.requests)
+    validate_links.validate_readme(content, cache=cache, max_workers=4)
+
+    assert len(report["errors"]) == 1 and "missing.svg" in report["errors"][0]
+    assert asset_server.paths()[probes:] == ["/missing.svg"]  # Only the broken image is re-probed
+
+
+def test_untrusted_image_is_an_error(monkeypatch):
+    monkeypatch.setattr(validate_links, "probe_url", lambda url, timeout: {"ok": True, "status": 200})
+    report = validate_links.validate_readme(
+        "![x](https://evil.example.com/x.png)", cache=None, check_links=False
+    )
+
+    assert report["errors"] == ["Image host is not a trusted service: https://evil.example.com/x.png"]
+
+
+def test_relative_image_is_an_error():
+    report = validate_links.validate_readme("![x](relative.png)", cache=None, check_links=False)
+
+    assert report["errors"] == ["Image is not an absolute URL: relative.png"]